@@ -24,57 +24,111 @@ import socket
 import sys
 import time
 import csv
+import codecs
+import gzip
 import os
 import re
 import shutil
+import shelve
+import stat
 import tempfile
-import subprocess
-import hashlib
 import random
 import string
-import logging
-import html
 import ipaddress
+import importlib.util
+import functools
+import itertools
+from operator import attrgetter
 import httpx
 from httpx import AsyncClient, Timeout
-from typing import List, Set, Dict, Optional, Any, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict, field
+from typing import List, Set, Dict, Optional, Any, Tuple, FrozenSet, Iterable
+from datetime import datetime
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from urllib.parse import urlparse, urlunparse
-from collections import defaultdict, Counter
-from concurrent.futures import ThreadPoolExecutor
-import gzip
-import base64
-import signal
+from types import MappingProxyType
+from urllib.parse import urlparse
+from collections import defaultdict, Counter, OrderedDict
 
 # Third-party imports
 import aiohttp
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp import ClientSession, TCPConnector
 import dns.resolver
 import dns.asyncresolver
 import dns.exception
-import tldextract
+import dns.name
+import dns.rdata
 
-# Optional rich output
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
-    from rich.panel import Panel
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# Optional HTTP/2 support for httpx (pip install "httpx[http2]")
+H2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Optional rich output (only needed for tables, so imported on first use)
+RICH_AVAILABLE = importlib.util.find_spec('rich') is not None
 
 # Optional color output
 try:
-    import colorama
-    from colorama import Fore, Style, Back, init as colorama_init
+    from colorama import Fore, Style, init as colorama_init
     colorama_init(autoreset=True)
     COLOR_AVAILABLE = True
 except ImportError:
     COLOR_AVAILABLE = False
 
+# Optional libuv-based event loop (Linux/macOS)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Optional fast JSON parser for large passive-source responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional incremental JSON parser for streaming large passive-source responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional c-ares DNS resolver (record lookups and aiohttp connections)
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for response body pattern scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional RE2 engine (linear time) for regexes run against response bodies
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional fast non-cryptographic hash for response body deduplication
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    import hashlib
+    XXHASH_AVAILABLE = False
+
+# Optional radix trie for cloud IP range lookups
+try:
+    import pytricia
+    PYTRICIA_AVAILABLE = True
+except ImportError:
+    PYTRICIA_AVAILABLE = False
+
 # ============================================================================
 # CONSTANTS & CONFIGURATION
 # ============================================================================
@@ -83,7 +137,7 @@ VERSION = "5.1.0"  # Advanced takeover detection: NS delegation, SSL mismatch, h
 AUTHOR = "Vimal T"
 BANNER = f"""
 ╔══════════════════════════════════════════════════════════════╗
-║                      SubDomain Sentinel v{5.1.0}                    ║
+║                      SubDomain Sentinel v{VERSION}                    ║
 ║           Enterprise Subdomain Takeover Scanner                    ║
 ╚══════════════════════════════════════════════════════════════╝
 """
@@ -615,7 +669,8 @@ CLOUD_IP_RANGES = {
         "159.65.0.0/16", "167.99.0.0/16", "174.138.0.0/16",
     ],
 }
-COMMON_SUBDOMAINS = [
+# Deduplicated in order at load so brute-force never resolves the same label twice
+COMMON_SUBDOMAINS = tuple(dict.fromkeys([
     "www", "mail", "web", "blog", "dev", "test", "staging", "api", "mobile", "admin",
     "dashboard", "portal", "ftp", "secure", "vpn", "ssh", "git", "jenkins",
     "nas", "files", "backup", "db", "mysql", "redis", "mongodb",
@@ -627,9 +682,9 @@ COMMON_SUBDOMAINS = [
     "data", "db1", "db2", "sql", "oracle", "postgres", "mariadb", "couchdb",
     "cassandra", "memcached", "rabbitmq", "kafka", "zookeeper", "etcd",
     "consul", "vault", "nomad", "terraform", "packer", "ansible", "puppet",
-    "chef", "salt", "jenkins", "bamboo", "teamcity", "gitlab", "bitbucket",
+    "chef", "salt", "bamboo", "teamcity", "gitlab", "bitbucket",
     "gogs", "gitea", "nexus", "artifactory", "sonar", "jira", "confluence",
-    "grafana", "prometheus", "alertmanager", "thanos", "cortex", "loki",
+    "alertmanager", "thanos", "cortex", "loki",
     "tempo", "jaeger", "zipkin", "skywalking", "pinpoint", "sentry",
     "logstash", "fluentd", "filebeat", "metricbeat", "packetbeat",
     "heartbeat", "auditbeat", "functionbeat", "journalbeat", "winlogbeat",
@@ -640,25 +695,289 @@ COMMON_SUBDOMAINS = [
     "jabber", "xmpp", "irc", "mattermost", "slack", "discord", "rocketchat",
     "zulip", "matrix", "element", "wire", "signal", "telegram", "whatsapp",
     "wechat", "line", "kakao", "viber", "threema", "session", "briar",
-    "tox", "retroshare", "jami", "delta", "beta", "gamma", "delta", "epsilon",
+    "tox", "retroshare", "jami", "delta", "gamma", "epsilon",
     "zeta", "eta", "theta", "iota", "kappa", "lambda", "mu", "nu", "xi",
     "omicron", "pi", "rho", "sigma", "tau", "upsilon", "phi", "chi", "psi",
     "omega", "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m",
     "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z"
-]
+]))
+
+# ============================================================================
+# PATTERN MATCHING INDEXES
+# ============================================================================
+
+# Regexes that see untrusted response text use RE2 when installed (no backtracking blowups)
+_body_re = re2 if RE2_AVAILABLE else re
+# Titles often carry attributes or span lines (<title data-rh="true">\n  Foo\n</title>)
+TITLE_RE = _body_re.compile(r'(?is)<title[^>]*>(.*?)</title>')
+
+def _freeze_provider_configs(configs: Dict[str, Dict[str, Any]]) -> MappingProxyType:
+    """Return a read-only copy of provider configs with tuple patterns, frozenset status
+    codes and interned strings"""
+    frozen = {}
+    for provider, config in configs.items():
+        config = dict(config)
+        for key in ('cname_patterns', 'error_patterns', 'claimed_indicators'):
+            if key in config:
+                config[key] = tuple(sys.intern(p) for p in config[key])
+        if 'status_codes' in config:
+            config['status_codes'] = frozenset(config['status_codes'])
+        for key in ('risk_level', 'verification_method'):
+            if key in config:
+                config[key] = sys.intern(config[key])
+        frozen[sys.intern(provider)] = MappingProxyType(config)
+    return MappingProxyType(frozen)
+
+PROVIDER_CONFIGS = _freeze_provider_configs(PROVIDER_CONFIGS)
+
+def _build_body_pattern_index() -> Dict[str, List[Tuple[str, str, str]]]:
+    """Map each lowercased error/claimed pattern to its (provider, kind, pattern) tags"""
+    index = defaultdict(list)
+    for provider, config in PROVIDER_CONFIGS.items():
+        for pattern in config.get('error_patterns', []):
+            index[pattern.lower()].append((provider, "error", pattern))
+        for pattern in config.get('claimed_indicators', []):
+            index[pattern.lower()].append((provider, "claimed", pattern))
+    return dict(index)
+
+def _build_body_automaton(patterns: Dict[str, List[Tuple[str, str, str]]]):
+    """Compile all body patterns into one Aho-Corasick automaton (None if unavailable)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for needle in patterns:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+_TRIE_END = "$"
+
+def _build_cname_suffix_trie() -> Tuple[Dict[str, Any], Tuple[Tuple[str, str], ...]]:
+    """Index label-aligned cname_patterns in a reverse-label trie ('.github.io' -> io -> github).
+    Patterns that cut through a label (e.g. '.s3-website-') are kept for substring checks."""
+    trie = {}
+    substring_patterns = []
+    for provider, config in PROVIDER_CONFIGS.items():
+        for pattern in config['cname_patterns']:
+            pattern = pattern.lower()
+            labels = pattern.strip('.').split('.')
+            if pattern.endswith(('.', '-')) or not all(labels):
+                substring_patterns.append((pattern, provider))
+                continue
+            node = trie
+            for label in reversed(labels):
+                node = node.setdefault(label, {})
+            # End marker: (provider for names with more labels in front, provider for the bare
+            # suffix itself). A leading dot needs another label, so it only fills the first slot;
+            # the first pattern registered for each slot wins, as in the old in-order scan.
+            deeper, exact = node.get(_TRIE_END, (None, None))
+            node[_TRIE_END] = (deeper or provider, exact or (None if pattern.startswith('.') else provider))
+    return trie, tuple(substring_patterns)
+
+def _build_cloud_ip_index():
+    """Compile CLOUD_IP_RANGES into a longest-prefix-match structure.
+    Uses a pytricia trie when available, else a most-specific-first network list."""
+    if PYTRICIA_AVAILABLE:
+        trie = pytricia.PyTricia()
+        for provider, cidrs in CLOUD_IP_RANGES.items():
+            for cidr in cidrs:
+                if not trie.has_key(cidr):
+                    trie.insert(cidr, provider)
+        return trie
+    networks = [(ipaddress.ip_network(cidr, strict=False), provider)
+                for provider, cidrs in CLOUD_IP_RANGES.items() for cidr in cidrs]
+    networks.sort(key=lambda item: item[0].prefixlen, reverse=True)
+    return tuple(networks)
+
+def _build_header_index() -> Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, int]]:
+    """Map each lowercased fingerprint header to its (provider, lowercased value) needles.
+    Also returns how many headers each provider's fingerprint requires."""
+    index = defaultdict(list)
+    required = {}
+    for provider, fingerprint in HEADER_FINGERPRINTS.items():
+        for header_name, expected_value in fingerprint.items():
+            index[header_name.lower()].append((provider, expected_value.lower()))
+        required[provider] = len(fingerprint)
+    return dict(index), required
+
+BODY_PATTERNS = _build_body_pattern_index()
+BODY_AUTOMATON = _build_body_automaton(BODY_PATTERNS)
+CNAME_SUFFIX_TRIE, CNAME_SUBSTRING_PATTERNS = _build_cname_suffix_trie()
+CLOUD_IP_INDEX = _build_cloud_ip_index()
+HEADER_INDEX, HEADER_FINGERPRINT_SIZES = _build_header_index()
+
+_PROVIDER_LIST_KEYS = ('cname_patterns', 'error_patterns', 'claimed_indicators', 'status_codes')
+
+def use_provider_configs(configs: Dict[str, Dict[str, Any]]):
+    """Install a new provider config set and rebuild every index derived from it"""
+    global PROVIDER_CONFIGS, BODY_PATTERNS, BODY_AUTOMATON, CNAME_SUFFIX_TRIE, CNAME_SUBSTRING_PATTERNS
+    PROVIDER_CONFIGS = _freeze_provider_configs(configs)
+    BODY_PATTERNS = _build_body_pattern_index()
+    BODY_AUTOMATON = _build_body_automaton(BODY_PATTERNS)
+    CNAME_SUFFIX_TRIE, CNAME_SUBSTRING_PATTERNS = _build_cname_suffix_trie()
+    _BODY_HITS_CACHE.clear()
+
+def load_providers_file(path: str) -> int:
+    """Merge provider definitions from a JSON file over the built-in ones.
+    The file maps provider name -> config using the PROVIDER_CONFIGS keys; fields given
+    for an existing provider replace the built-in values. Returns the number of entries."""
+    with open(path, 'rb') as f:
+        overrides = json_loads(f.read())
+    if not isinstance(overrides, dict):
+        raise ValueError("expected a JSON object mapping provider name to its config")
+    
+    merged = {name: dict(config) for name, config in PROVIDER_CONFIGS.items()}
+    for name, config in overrides.items():
+        if not isinstance(config, dict):
+            raise ValueError(f"provider '{name}': config must be a JSON object")
+        for key in _PROVIDER_LIST_KEYS:
+            if key in config and not isinstance(config[key], list):
+                raise ValueError(f"provider '{name}': '{key}' must be a list")
+        entry = merged.setdefault(name, {key: [] for key in _PROVIDER_LIST_KEYS})
+        entry.update(config)
+    
+    use_provider_configs(merged)
+    return len(overrides)
+
+def match_headers(headers: Dict[str, str]) -> Set[str]:
+    """Return every provider whose full header fingerprint matches (case-insensitive)"""
+    if not headers:
+        return set()
+    
+    counts = Counter()
+    for name, value in headers.items():
+        needles = HEADER_INDEX.get(name.lower())
+        if not needles or not value:
+            continue
+        value_lower = value.lower()
+        for provider, needle in needles:
+            if needle in value_lower:
+                counts[provider] += 1
+    return {provider for provider, count in counts.items()
+            if count == HEADER_FINGERPRINT_SIZES[provider]}
+
+def classify_ip(ip: str) -> Optional[str]:
+    """Return the cloud provider owning ip, or None if it is not in CLOUD_IP_RANGES"""
+    if PYTRICIA_AVAILABLE:
+        try:
+            return CLOUD_IP_INDEX.get(ip)
+        except (ValueError, TypeError):
+            return None
+    try:
+        addr = ipaddress.ip_address(ip)
+    except (ValueError, TypeError):
+        return None
+    for network, provider in CLOUD_IP_INDEX:
+        if addr in network:
+            return provider
+    return None
+
+def match_cname(cname: str) -> Optional[str]:
+    """Return the provider whose CNAME pattern matches cname (deepest suffix wins)"""
+    if not cname:
+        return None
+    
+    cname_lower = cname.lower().rstrip('.')
+    labels = cname_lower.split('.')
+    node = CNAME_SUFFIX_TRIE
+    provider = None
+    for depth, label in enumerate(reversed(labels), 1):
+        node = node.get(label)
+        if node is None:
+            break
+        hit = node.get(_TRIE_END)
+        if hit:
+            provider = (hit[0] if depth < len(labels) else hit[1]) or provider
+    if provider:
+        return provider
+    
+    for pattern, candidate in CNAME_SUBSTRING_PATTERNS:
+        if pattern in cname_lower:
+            return candidate
+    return None
+
+# Host of an absolute http(s) URL, skipping any userinfo and stopping at port, path, query or fragment
+URL_HOST_RE = _body_re.compile(r'(?i)^https?://(?:[^/@?#]*@)?([^/:?#@]+)')
+
+def build_host_filter_re(domains):
+    """One multiline regex that pulls the hostname out of every line naming a host at or below one
+    of domains, tolerating a scheme, trailing dot, port or path ("https://a.example.com:443/x").
+    Labels must be whole, so "evilexample.com" does not match "example.com"."""
+    parents = '|'.join(re.escape(d.lower().strip('.')) for d in domains)
+    return _body_re.compile(
+        r'(?im)^[ \t]*(?:https?://)?((?:[^\s/:.]+\.)*(?:' + parents + r'))\.?(?:[:/][^\n]*)?[ \t]*$')
+
+def scan_body(body: str) -> Dict[str, List[Tuple[str, str]]]:
+    """Scan a lowercased response body once for every provider's patterns.
+    Returns {provider: [(kind, pattern), ...]} for all patterns found."""
+    if not body:
+        return {}
+    
+    if BODY_AUTOMATON is not None:
+        matched = {needle for _, needle in BODY_AUTOMATON.iter(body)}
+    else:
+        matched = [needle for needle in BODY_PATTERNS if needle in body]
+    
+    hits = defaultdict(list)
+    for needle in matched:
+        for provider, kind, pattern in BODY_PATTERNS[needle]:
+            hits[provider].append((kind, pattern))
+    return hits
+
+def body_fingerprint(data: bytes) -> int:
+    """64-bit fingerprint of a response body for dedup (not for anything security-relevant)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+# Identical error pages (same provider, many dangling hosts) are scanned only once
+_BODY_HITS_CACHE: Dict[Tuple[int, str], Dict[str, List[Tuple[str, str]]]] = {}
+_BODY_HITS_CACHE_MAX = 4096
+
+def scan_body_cached(key: Tuple[int, str], body: str) -> Dict[str, List[Tuple[str, str]]]:
+    """scan_body() memoized on (body_fingerprint, charset) of the raw response bytes"""
+    hits = _BODY_HITS_CACHE.get(key)
+    if hits is None:
+        if len(_BODY_HITS_CACHE) >= _BODY_HITS_CACHE_MAX:
+            _BODY_HITS_CACHE.clear()
+        hits = _BODY_HITS_CACHE[key] = scan_body(body.lower())
+    return hits
 
 # ============================================================================
 # SUBFINDER INTEGRATION MODULE
 # ============================================================================
 
+# Console lines for the subfinder stage, colored once at import when colorama is present
+if COLOR_AVAILABLE:
+    _SUBFINDER_HEADER = (f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n"
+                         f"{Fore.CYAN}🔍 SUBFINDER ENUMERATION{Style.RESET_ALL}\n"
+                         f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+    _SUBFINDER_WARN = f"{Fore.YELLOW}[!] Subfinder: {{}}{Style.RESET_ALL}"
+    _SUBFINDER_FOUND = f"{Fore.GREEN}[+] Subfinder found: {{}} subdomains{Style.RESET_ALL}"
+    _SUBFINDER_FAILED = f"{Fore.RED}[!] Subfinder enumeration failed: {{}}{Style.RESET_ALL}"
+else:
+    _SUBFINDER_HEADER = f"\n{'='*60}\n🔍 SUBFINDER ENUMERATION\n{'='*60}"
+    _SUBFINDER_WARN = "[!] Subfinder: {}"
+    _SUBFINDER_FOUND = "[+] Subfinder found: {} subdomains"
+    _SUBFINDER_FAILED = "[!] Subfinder enumeration failed: {}"
+
+def is_executable_file(path: str) -> bool:
+    """Regular file with an execute bit set, checked with a single stat() call"""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
 class SubfinderIntegration:
     """Complete Subfinder integration module"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def find_subfinder_binary(custom_path: str = None) -> Optional[str]:
-        """Find subfinder binary in system PATH or custom location"""
+        """Find subfinder binary in system PATH or custom location (memoized per path)"""
         if custom_path:
-            if os.path.isfile(custom_path) and os.access(custom_path, os.X_OK):
+            if is_executable_file(custom_path):
                 return custom_path
             path = shutil.which(custom_path)
             if path:
@@ -678,7 +997,7 @@ class SubfinderIntegration:
         ]
         
         for path in common_paths:
-            if os.path.isfile(path) and os.access(path, os.X_OK):
+            if is_executable_file(path):
                 return path
         
         return None
@@ -686,18 +1005,18 @@ class SubfinderIntegration:
     @staticmethod
     async def run_subfinder(
         domain: str,
-        output_file: str,
         binary_path: str = "subfinder",
         extra_args: str = "",
         timeout: int = 300,
         debug: bool = False
-    ) -> Tuple[bool, str]:
-        """Run subfinder binary"""
+    ) -> Tuple[bool, str, Set[str]]:
+        """Run subfinder binary, parsing hostnames from its stdout as they are printed"""
+        subdomains = set()
         binary = SubfinderIntegration.find_subfinder_binary(binary_path)
         if not binary:
-            return False, f"Subfinder binary not found: {binary_path}"
+            return False, f"Subfinder binary not found: {binary_path}", subdomains
         
-        cmd = [binary, "-d", domain, "-silent", "-o", output_file]
+        cmd = [binary, "-d", domain, "-silent"]
         
         if extra_args:
             import shlex
@@ -716,6 +1035,32 @@ class SubfinderIntegration:
         if debug:
             print(f"[SUBFINDER] Command: {' '.join(cmd)}")
         
+        domain_b = domain.lower().encode()
+        suffix_b = b"." + domain_b
+        parse = SubfinderIntegration.parse_subfinder_line
+        
+        # Pick the per-host handler once so the normal read loop carries no debug checks
+        if debug:
+            def collect(host: str):
+                if host not in subdomains:
+                    subdomains.add(host)
+                    if len(subdomains) <= 10:
+                        print(f"[SUBFINDER-PARSED] {host}")
+        else:
+            collect = subdomains.add
+        
+        async def read_stdout():
+            readline = process.stdout.readline
+            while True:
+                raw = await readline()
+                if not raw:
+                    break
+                host = parse(raw, domain_b, suffix_b)
+                if host:
+                    collect(host)
+            await process.wait()
+        
+        process = None
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -723,65 +1068,55 @@ class SubfinderIntegration:
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
-            )
+            # Drain stderr alongside stdout so a chatty subfinder cannot block on a full pipe
+            stderr_task = asyncio.ensure_future(process.stderr.read())
+            try:
+                await asyncio.wait_for(read_stdout(), timeout=timeout)
+            except asyncio.TimeoutError:
+                stderr_task.cancel()
+                raise
+            stderr = await stderr_task
             
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
+            if subdomains:
                 if debug:
-                    print(f"[SUBFINDER] Success: Found {sum(1 for _ in open(output_file))} subdomains")
-                return True, "Success"
+                    print(f"[SUBFINDER] Success: Found {len(subdomains)} subdomains")
+                return True, "Success", subdomains
             
             if process.returncode != 0:
                 error_msg = stderr.decode('utf-8', errors='ignore').strip()
                 if debug:
                     print(f"[SUBFINDER] Error (code {process.returncode}): {error_msg}")
-                return False, f"Subfinder failed: {error_msg}"
+                return False, f"Subfinder failed: {error_msg}", subdomains
             
-            return False, "Subfinder produced no output"
+            return False, "Subfinder produced no output", subdomains
             
         except asyncio.TimeoutError:
-            return False, f"Subfinder timeout after {timeout} seconds"
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            return False, f"Subfinder timeout after {timeout} seconds", subdomains
         except FileNotFoundError:
-            return False, f"Subfinder binary not found at: {binary}"
+            return False, f"Subfinder binary not found at: {binary}", subdomains
         except Exception as e:
-            return False, f"Subfinder execution error: {str(e)}"
+            return False, f"Subfinder execution error: {str(e)}", subdomains
     
     @staticmethod
-    def parse_subfinder_output(file_path: str, domain: str, debug: bool = False) -> Set[str]:
-        """Parse subfinder output file"""
-        subdomains = set()
-        
-        if not os.path.exists(file_path):
-            return subdomains
+    def parse_subfinder_line(raw: bytes, domain: bytes, suffix: bytes) -> Optional[str]:
+        """Reduce one raw output line to a lowercase hostname under domain, or None"""
+        # partition() stops at the first separator and never builds a list of fields
+        host = raw.strip().partition(b' ')[0]
+        if not host:
+            return None
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    line = line.split()[0]
-                    line = re.sub(r'^https?://', '', line)
-                    line = line.split(':')[0]
-                    line = line.rstrip('/')
-                    line = line.lower().strip()
-                    
-                    if line.endswith(f".{domain}") or line == domain:
-                        subdomains.add(line)
-                        if debug and len(subdomains) <= 10:
-                            print(f"[SUBFINDER-PARSED] {line}")
-            
-            if debug:
-                print(f"[SUBFINDER] Parsed {len(subdomains)} unique subdomains")
-                
-        except Exception as e:
-            if debug:
-                print(f"[SUBFINDER] Parse error: {e}")
+        if host[:4].lower() == b'http':
+            scheme, sep, rest = host.partition(b'://')
+            if sep and scheme.lower() in (b'http', b'https'):
+                host = rest
+        host = host.partition(b'/')[0].partition(b':')[0].lower()
         
-        return subdomains
+        if host.endswith(suffix) or host == domain:
+            return host.decode('utf-8', errors='ignore')
+        return None
     
     @staticmethod
     async def enumerate_with_subfinder(
@@ -795,23 +1130,12 @@ class SubfinderIntegration:
         if not use_subfinder:
             return set()
         
-        if COLOR_AVAILABLE:
-            print(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}🔍 SUBFINDER ENUMERATION{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-        else:
-            print(f"\n{'='*60}")
-            print("🔍 SUBFINDER ENUMERATION")
-            print(f"{'='*60}")
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as tmp:
-            temp_file = tmp.name
+        print(_SUBFINDER_HEADER)
         
         try:
             print(f"[*] Running Subfinder for {domain}...")
-            success, message = await SubfinderIntegration.run_subfinder(
+            success, message, subdomains = await SubfinderIntegration.run_subfinder(
                 domain=domain,
-                output_file=temp_file,
                 binary_path=subfinder_bin,
                 extra_args=subfinder_args,
                 timeout=600,
@@ -819,18 +1143,10 @@ class SubfinderIntegration:
             )
             
             if not success:
-                if COLOR_AVAILABLE:
-                    print(f"{Fore.YELLOW}[!] Subfinder: {message}{Style.RESET_ALL}")
-                else:
-                    print(f"[!] Subfinder: {message}")
+                print(_SUBFINDER_WARN.format(message))
                 return set()
             
-            subdomains = SubfinderIntegration.parse_subfinder_output(temp_file, domain, debug)
-            
-            if COLOR_AVAILABLE:
-                print(f"{Fore.GREEN}[+] Subfinder found: {len(subdomains)} subdomains{Style.RESET_ALL}")
-            else:
-                print(f"[+] Subfinder found: {len(subdomains)} subdomains")
+            print(_SUBFINDER_FOUND.format(len(subdomains)))
             
             if debug and subdomains:
                 sample = list(subdomains)[:5]
@@ -839,16 +1155,145 @@ class SubfinderIntegration:
             return subdomains
             
         except Exception as e:
-            if COLOR_AVAILABLE:
-                print(f"{Fore.RED}[!] Subfinder enumeration failed: {e}{Style.RESET_ALL}")
-            else:
-                print(f"[!] Subfinder enumeration failed: {e}")
+            print(_SUBFINDER_FAILED.format(e))
             return set()
-        finally:
+
+# ============================================================================
+# MASSDNS INTEGRATION MODULE
+# ============================================================================
+
+# Below this many names the massdns process startup costs more than in-process resolution
+MASSDNS_MIN_TARGETS = 200
+
+# Public resolvers written to a temporary resolver file when none is configured
+DEFAULT_MASSDNS_RESOLVERS = (
+    "1.1.1.1", "1.0.0.1",           # Cloudflare
+    "8.8.8.8", "8.8.4.4",           # Google
+    "9.9.9.9", "149.112.112.112",   # Quad9
+)
+
+class MassdnsIntegration:
+    """Bulk brute-force resolution through the massdns stub resolver"""
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def find_massdns_binary(custom_path: str = None) -> Optional[str]:
+        """Find massdns binary in system PATH or custom location (memoized per path)"""
+        if custom_path:
+            if is_executable_file(custom_path):
+                return custom_path
+            path = shutil.which(custom_path)
+            if path:
+                return path
+        
+        path = shutil.which("massdns")
+        if path:
+            return path
+        
+        for path in ["/usr/local/bin/massdns", "/usr/bin/massdns", "/opt/homebrew/bin/massdns"]:
+            if is_executable_file(path):
+                return path
+        
+        return None
+    
+    @staticmethod
+    def parse_massdns_output(output: bytes, wildcard_ips: FrozenSet[str] = frozenset(),
+                             wildcard_cnames: FrozenSet[str] = frozenset()) -> Set[str]:
+        """Parse massdns NDJSON (-o J) output into names that returned answers. As in
+        SubdomainEnumerator.check_subdomain_exists, a name whose A records all belong to
+        wildcard_ips and whose CNAMEs all point at wildcard_cnames is a wildcard echo and dropped."""
+        resolved = set()
+        for line in output.splitlines():
             try:
-                os.unlink(temp_file)
-            except:
-                pass
+                record = json.loads(line)
+            except ValueError:
+                continue
+            answers = record.get('data', {}).get('answers') if record.get('status') == 'NOERROR' else None
+            if not answers:
+                continue
+            if wildcard_ips or wildcard_cnames:
+                a_records = {answer.get('data', '') for answer in answers if answer.get('type') == 'A'}
+                cnames = {answer.get('data', '').rstrip('.').lower()
+                          for answer in answers if answer.get('type') == 'CNAME'}
+                own_a = a_records and not wildcard_ips.issuperset(a_records)
+                if not own_a and cnames.issubset(wildcard_cnames):
+                    continue
+            resolved.add(record.get('name', '').rstrip('.').lower())
+        resolved.discard('')
+        return resolved
+    
+    @staticmethod
+    async def resolve(
+        hostnames: Tuple[str, ...],
+        binary_path: str,
+        resolvers_file: str = None,
+        nameservers: List[str] = None,
+        timeout: int = 600,
+        debug: bool = False,
+        wildcard_ips: FrozenSet[str] = frozenset(),
+        wildcard_cnames: FrozenSet[str] = frozenset()
+    ) -> Optional[Set[str]]:
+        """Resolve hostnames with massdns, returning those that exist (None on failure).
+        Answers that only repeat the parent's wildcard are not counted (see parse_massdns_output)."""
+        temp_resolvers = None
+        if not resolvers_file:
+            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as tmp:
+                tmp.write("\n".join(nameservers or DEFAULT_MASSDNS_RESOLVERS) + "\n")
+                temp_resolvers = resolvers_file = tmp.name
+        
+        cmd = [binary_path, "-r", resolvers_file, "-t", "A", "-o", "J", "-q"]
+        # One buffer for the whole candidate list, written to stdin in a single call
+        payload = ("\n".join(hostnames) + "\n").encode()
+        if debug:
+            print(f"[MASSDNS] Command: {' '.join(cmd)}")
+        
+        process = None
+        try:
+            # stderr is only ever shown in debug mode, otherwise let the kernel discard it
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE if debug else asyncio.subprocess.DEVNULL
+            )
+            
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(payload),
+                timeout=timeout
+            )
+            
+            if process.returncode != 0:
+                if debug:
+                    error_msg = stderr.decode('utf-8', errors='ignore').strip()
+                    print(f"[MASSDNS] Error (code {process.returncode}): {error_msg}")
+                return None
+            
+            resolved = MassdnsIntegration.parse_massdns_output(stdout, wildcard_ips, wildcard_cnames)
+            if debug:
+                print(f"[MASSDNS] Resolved {len(resolved)} of {len(hostnames)} names")
+            return resolved
+            
+        except asyncio.TimeoutError:
+            # Kill and reap the child so a slow massdns does not linger as a zombie
+            if process is not None and process.returncode is None:
+                try:
+                    process.kill()
+                    await process.wait()
+                except ProcessLookupError:
+                    pass
+            if debug:
+                print(f"[MASSDNS] Timeout after {timeout} seconds")
+            return None
+        except Exception as e:
+            if debug:
+                print(f"[MASSDNS] Execution error: {e}")
+            return None
+        finally:
+            if temp_resolvers:
+                try:
+                    os.unlink(temp_resolvers)
+                except:
+                    pass
 
 # ============================================================================
 # DATA MODELS
@@ -870,7 +1315,10 @@ class TakeoverStatus(Enum):
     SAFE = "SAFE"
     ERROR = "ERROR"
 
-@dataclass
+# One finding is kept per subdomain, so drop the per-instance __dict__ where dataclasses support it (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class SubdomainFinding:
     """Complete finding data model with httpx enhancements"""
     subdomain: str
@@ -930,7 +1378,7 @@ class SubdomainFinding:
             "header_fingerprint": self.header_fingerprint
         }
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScanResult:
     """Overall scan results"""
     domain: str
@@ -939,6 +1387,7 @@ class ScanResult:
     total_subdomains: int
     findings: List[SubdomainFinding]
     statistics: Dict[str, Any] = field(default_factory=dict)
+    critical_findings: List[SubdomainFinding] = field(default_factory=list)
     
     def to_dict(self):
         return {
@@ -949,35 +1398,73 @@ class ScanResult:
             "findings": [f.to_dict() for f in self.findings],
             "statistics": self.statistics
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize the scan result to JSON (orjson when installed)"""
+        return json_dumps(self.to_dict())
+    
+    def iter_json_chunks(self):
+        """Yield the same bytes as to_json_bytes() piece by piece, one finding at a time,
+        so the findings are never all converted to dicts at once"""
+        head = json_dumps({
+            "domain": self.domain,
+            "timestamp": self.timestamp.isoformat(),
+            "duration": self.duration,
+            "total_subdomains": self.total_subdomains,
+        })
+        # Reopen the header object and nest each finding two levels deep; JSON
+        # strings never hold a raw newline, so re-indenting is a plain replace
+        yield head[:-2]
+        if not self.findings:
+            yield b',\n  "findings": []'
+        else:
+            yield b',\n  "findings": [\n'
+            sep = b''
+            for finding in self.findings:
+                yield sep + b'    ' + json_dumps(finding.to_dict()).replace(b'\n', b'\n    ')
+                sep = b',\n'
+            yield b'\n  ]'
+        yield b',\n  "statistics": ' + json_dumps(self.statistics).replace(b'\n', b'\n  ') + b'\n}'
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# "[LEVEL] " prefixes for ColorPrinter, rendered once instead of on every call
+_LOG_LEVELS = ("info", "success", "warning", "error", "critical", "debug")
+_PLAIN_PREFIXES = MappingProxyType({level: f"[{level.upper()}] " for level in _LOG_LEVELS})
+if COLOR_AVAILABLE:
+    _LEVEL_COLORS = {
+        "info": Fore.CYAN,
+        "success": Fore.GREEN,
+        "warning": Fore.YELLOW,
+        "error": Fore.RED,
+        "critical": Fore.RED + Style.BRIGHT,
+        "debug": Fore.MAGENTA,
+    }
+    _COLOR_PREFIXES = MappingProxyType({level: f"{code}[{level.upper()}] {Style.RESET_ALL}"
+                                        for level, code in _LEVEL_COLORS.items()})
+else:
+    _COLOR_PREFIXES = _PLAIN_PREFIXES
+
 class ColorPrinter:
     """Colorful console output"""
     _no_color = False  # Class-level flag set from CLI
     
     @staticmethod
-    def print(message: str, level: str = "info", color: str = None):
+    def format(message: str, level: str = "info", color: str = None) -> str:
+        """The line print() would write, without the trailing newline"""
         if not COLOR_AVAILABLE or ColorPrinter._no_color:
-            print(f"[{level.upper()}] {message}")
-            return
-        
-        colors = {
-            "info": Fore.CYAN,
-            "success": Fore.GREEN,
-            "warning": Fore.YELLOW,
-            "error": Fore.RED,
-            "critical": Fore.RED + Style.BRIGHT,
-            "debug": Fore.MAGENTA,
-        }
-        
-        color_code = colors.get(level, Fore.WHITE)
-        if color:
-            color_code = getattr(Fore, color.upper(), Fore.WHITE)
-        
-        print(f"{color_code}[{level.upper()}] {Style.RESET_ALL}{message}")
+            prefix = _PLAIN_PREFIXES.get(level) or f"[{level.upper()}] "
+        elif color:
+            prefix = f"{getattr(Fore, color.upper(), Fore.WHITE)}[{level.upper()}] {Style.RESET_ALL}"
+        else:
+            prefix = _COLOR_PREFIXES.get(level) or f"{Fore.WHITE}[{level.upper()}] {Style.RESET_ALL}"
+        return f"{prefix}{message}"
+    
+    @staticmethod
+    def print(message: str, level: str = "info", color: str = None):
+        sys.stdout.write(ColorPrinter.format(message, level, color) + "\n")
     
     @staticmethod
     def print_banner():
@@ -986,6 +1473,8 @@ class ColorPrinter:
     @staticmethod
     def print_table(headers: List[str], rows: List[List[str]], title: str = None):
         if RICH_AVAILABLE:
+            from rich.console import Console
+            from rich.table import Table
             table = Table(title=title, show_header=True, header_style="bold magenta")
             for header in headers:
                 table.add_column(header)
@@ -1001,299 +1490,688 @@ class ColorPrinter:
             for row in rows:
                 print(" | ".join(row))
 
+# Public suffix lookups use the PSL snapshot bundled with tldextract (no network refresh).
+# tldextract is imported on first use since it loads the suffix list at import time.
+_TLD_EXTRACTOR = None
+
+def registered_domain(name: str) -> str:
+    """Registrable domain of name ('a.b.example.co.uk' -> 'example.co.uk')"""
+    global _TLD_EXTRACTOR
+    name = name.strip().lower().rstrip('.')
+    try:
+        if _TLD_EXTRACTOR is None:
+            import tldextract
+            _TLD_EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+        extracted = _TLD_EXTRACTOR(name)
+        if extracted.domain and extracted.suffix:
+            return f"{extracted.domain}.{extracted.suffix}"
+    except ImportError:
+        # Fall back to the last two labels
+        parts = name.split('.')
+        if len(parts) >= 2:
+            return '.'.join(parts[-2:])
+    return name
+
 class RateLimiter:
-    """Rate limiting for API calls"""
+    """Rate limiting for API calls, paced separately per host (calls_per_second <= 0 disables it)"""
+    # Past this many tracked hosts, hosts whose next slot is already free are forgotten
+    PRUNE_AT = 4096
+    
     def __init__(self, calls_per_second: int = 10):
         self.calls_per_second = calls_per_second
-        self.semaphore = asyncio.Semaphore(calls_per_second)
-        self.last_call = 0
-        self.min_interval = 1.0 / calls_per_second
-    
-    async def wait(self):
-        async with self.semaphore:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self.last_call = time.time()
+        self.min_interval = 1.0 / calls_per_second if calls_per_second > 0 else 0.0
+        self.next_slots: Dict[str, float] = {}
+    
+    async def wait(self, host: str = ""):
+        """Wait for the next call slot for host; different hosts never wait on each other"""
+        if not self.min_interval:
+            return
+        # Reserving the slot has no await, so it is atomic on the event loop without a lock.
+        # Sleeping after the reservation spaces callers min_interval apart instead of
+        # queueing them behind each other's sleeps.
+        now = time.monotonic()
+        next_slot = self.next_slots.get(host, now)
+        delay = next_slot - now
+        if len(self.next_slots) >= self.PRUNE_AT:
+            self.next_slots = {h: slot for h, slot in self.next_slots.items() if slot > now}
+        self.next_slots[host] = max(now, next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+def build_tcp_connector(nameservers: List[str] = None) -> TCPConnector:
+    """aiohttp connector that resolves through c-ares (aiodns) when available"""
+    resolver = None
+    # aiodns needs a selector event loop, which Windows does not use by default
+    if AIODNS_AVAILABLE and sys.platform != 'win32':
+        resolver = aiohttp.AsyncResolver(nameservers=nameservers) if nameservers else aiohttp.AsyncResolver()
+    return TCPConnector(limit=500, limit_per_host=20, ttl_dns_cache=300,
+                        use_dns_cache=True, resolver=resolver)
+
+# Responses above this size are parsed in a worker thread so the event loop keeps running
+JSON_OFFLOAD_BYTES = 1 << 20
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, else the stdlib parser"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON, stringifying unknown types like json.dump(default=str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+async def json_loads_async(raw: bytes) -> Any:
+    """Parse JSON bytes, moving multi-megabyte payloads off the event loop"""
+    if len(raw) < JSON_OFFLOAD_BYTES:
+        return json_loads(raw)
+    return await asyncio.get_running_loop().run_in_executor(None, json_loads, raw)
+
+JSON_STREAM_CHUNK = 65536
+
+async def iter_json_array(resp: aiohttp.ClientResponse):
+    """Yield the elements of a top-level JSON array response.
+    Large or unsized bodies are parsed with ijson as chunks arrive, so the whole document is never
+    held in memory; small ones (and everything without ijson) go through a single json_loads."""
+    size = resp.content_length
+    if not IJSON_AVAILABLE or (size is not None and size < JSON_OFFLOAD_BYTES):
+        data = await json_loads_async(await resp.read())
+        for item in data if isinstance(data, list) else ():
+            yield item
+        return
+    
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, 'item', use_float=True)
+    async for chunk in resp.content.iter_chunked(JSON_STREAM_CHUNK):
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
+
+async def iter_lines(resp: aiohttp.ClientResponse):
+    """Yield the raw lines of a response body as they arrive, holding at most one chunk plus
+    a partial line in memory"""
+    buf = b""
+    async for chunk in resp.content.iter_chunked(JSON_STREAM_CHUNK):
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            yield line
+    if buf:
+        yield buf
+
+# Scan-wide cap on in-flight network operations (DNS queries, HTTP requests, TLS probes).
+# The semaphore is created lazily so it binds to the running event loop.
+_NETWORK_LIMIT = 300
+_NETWORK_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+def set_network_limit(limit: int):
+    """Set how many network operations may be in flight at once"""
+    global _NETWORK_LIMIT, _NETWORK_SEMAPHORE
+    _NETWORK_LIMIT = max(1, int(limit))
+    _NETWORK_SEMAPHORE = None
+
+def network_slot() -> asyncio.Semaphore:
+    """Semaphore every network call site holds while its operation is in flight"""
+    global _NETWORK_SEMAPHORE
+    if _NETWORK_SEMAPHORE is None:
+        _NETWORK_SEMAPHORE = asyncio.Semaphore(_NETWORK_LIMIT)
+    return _NETWORK_SEMAPHORE
+
+class TTLCache:
+    """Bounded in-memory mapping: entries expire ttl seconds after insertion, least recently used are evicted first"""
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        if item[0] < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return item[1]
+    
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+_CACHE_MISS = object()
+
+# Persistent DNS answer cache shared across runs, opened by open_dns_cache().
+# Entries are "<rdtype>:<name>" -> (expires_at, [rdata text]); only positive answers are stored.
+# The shelf is only read at open and written at close; lookups in between use the in-memory copy.
+DNS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "subdomain-sentinel", "dns")
+# Unexpired entries kept on disk; beyond this the ones expiring soonest are dropped
+DNS_CACHE_MAX_ENTRIES = 200_000
+_DNS_CACHE: Optional[Dict[str, Tuple[float, List[str]]]] = None
+_DNS_CACHE_FILE: Optional[str] = None
+_DNS_CACHE_DIRTY: Set[str] = set()
+_DNS_CACHE_REMOVED: Set[str] = set()
+
+def _prune_dns_cache(entries: Dict[str, Tuple[float, List[str]]]) -> Set[str]:
+    """Remove expired entries, then the soonest-expiring ones above DNS_CACHE_MAX_ENTRIES.
+    Returns the removed keys."""
+    now = time.time()
+    removed = {key for key, (expires_at, _) in entries.items() if expires_at <= now}
+    for key in removed:
+        del entries[key]
+    excess = len(entries) - DNS_CACHE_MAX_ENTRIES
+    if excess > 0:
+        for key in sorted(entries, key=lambda k: entries[k][0])[:excess]:
+            del entries[key]
+            removed.add(key)
+    return removed
+
+def open_dns_cache(path: str = DNS_CACHE_PATH):
+    """Load the on-disk DNS cache, dropping expired, unreadable and excess entries from it.
+    Blocking; the scan continues uncached if it cannot be opened."""
+    global _DNS_CACHE, _DNS_CACHE_FILE
+    if _DNS_CACHE is not None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entries = {}
+        unreadable = []
+        with shelve.open(path) as shelf:
+            for key in list(shelf.keys()):
+                try:
+                    expires_at, texts = shelf[key]
+                    entries[key] = (float(expires_at), list(texts))
+                except Exception:
+                    unreadable.append(key)
+            for key in unreadable + sorted(_prune_dns_cache(entries)):
+                del shelf[key]
+    except Exception as e:
+        ColorPrinter.print(f"DNS cache disabled ({path}): {e}", "warning")
+        return
+    _DNS_CACHE, _DNS_CACHE_FILE = entries, path
+    _DNS_CACHE_DIRTY.clear()
+    _DNS_CACHE_REMOVED.clear()
+
+def close_dns_cache():
+    """Write this scan's new answers to disk and drop expired and excess entries (blocking)"""
+    global _DNS_CACHE
+    if _DNS_CACHE is None:
+        return
+    entries, _DNS_CACHE = _DNS_CACHE, None
+    removed = _DNS_CACHE_REMOVED | _prune_dns_cache(entries)
+    try:
+        with shelve.open(_DNS_CACHE_FILE) as shelf:
+            for key in removed:
+                if key in shelf:
+                    del shelf[key]
+            for key in _DNS_CACHE_DIRTY:
+                if key in entries:
+                    shelf[key] = entries[key]
+    except Exception:
+        pass
+    _DNS_CACHE_DIRTY.clear()
+    _DNS_CACHE_REMOVED.clear()
+
+def _dns_cache_drop(key: str) -> None:
+    _DNS_CACHE.pop(key, None)
+    _DNS_CACHE_DIRTY.discard(key)
+    _DNS_CACHE_REMOVED.add(key)
+
+def _dns_cache_get(key: str, rdtype: str) -> Optional[List[Any]]:
+    """Return cached rdata objects for key, or None if missing, expired or unreadable"""
+    entry = _DNS_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, texts = entry
+    if expires_at < time.time():
+        _dns_cache_drop(key)
+        return None
+    try:
+        return [dns.rdata.from_text('IN', rdtype, text) for text in texts]
+    except Exception:
+        # Corrupt, or written in a format this version cannot parse: a miss, and forgotten
+        _dns_cache_drop(key)
+        return None
+
+def _dns_cache_put(key: str, ttl: int, rdatas: List[Any]) -> None:
+    """Store rdata objects for ttl seconds"""
+    if ttl <= 0:
+        return
+    _DNS_CACHE[key] = (time.time() + ttl, [rdata.to_text() for rdata in rdatas])
+    _DNS_CACHE_DIRTY.add(key)
+    _DNS_CACHE_REMOVED.discard(key)
+
+# TLS certificate probe deadlines: a silent port fails after the connect timeout alone
+TLS_CONNECT_TIMEOUT = 3.0
+TLS_HANDSHAKE_TIMEOUT = 2.0
+
+# Only the start of a page is kept for analysis, so bodies are streamed and cut off early
+HTTP_BODY_CHARS = 5000
+HTTP_BODY_READ_BYTES = 16384
+
+@functools.lru_cache(maxsize=64)
+def body_encoding(charset: Optional[str]) -> str:
+    """Canonical codec name for a response charset; missing or unknown ones (charset=utf8mb4) fall back to UTF-8"""
+    if charset:
+        try:
+            name = codecs.lookup(charset).name
+            # Binary codecs such as base64 resolve too, but bytes.decode() rejects them
+            b'x'.decode(name, 'replace')
+            return name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+async def read_body_prefix(resp: httpx.Response, limit: int = HTTP_BODY_READ_BYTES) -> bytes:
+    """Read at most ~limit bytes of a streamed httpx response without downloading the rest"""
+    chunks = []
+    size = 0
+    async for chunk in resp.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b''.join(chunks)[:limit]
+
+# Shared HTTP clients, created lazily on first use and closed by close_http_clients().
+# Construction is synchronous, so no lock is needed on a single event loop.
+_HTTPX_CLIENT: Optional[AsyncClient] = None
+_AIOHTTP_SESSION: Optional[ClientSession] = None
+
+HTTP_PROBE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+def get_httpx(timeout: float = 10) -> AsyncClient:
+    """Return the scan-wide httpx client, keeping connections alive across subdomains.
+    With h2 installed, HTTP/2 lets subdomains on one provider edge share a connection."""
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is None or _HTTPX_CLIENT.is_closed:
+        _HTTPX_CLIENT = AsyncClient(
+            http2=H2_AVAILABLE,
+            timeout=Timeout(float(timeout), connect=5.0, write=5.0, pool=None),
+            limits=httpx.Limits(max_connections=500, max_keepalive_connections=250),
+            headers=HTTP_PROBE_HEADERS,
+            follow_redirects=True,
+            verify=False
+        )
+    return _HTTPX_CLIENT
+
+def get_aiohttp(nameservers: List[str] = None) -> ClientSession:
+    """Return the scan-wide aiohttp session used by the passive enumeration sources"""
+    global _AIOHTTP_SESSION
+    if _AIOHTTP_SESSION is None or _AIOHTTP_SESSION.closed:
+        _AIOHTTP_SESSION = ClientSession(connector=build_tcp_connector(nameservers))
+    return _AIOHTTP_SESSION
+
+async def close_http_clients():
+    """Close the shared HTTP clients (call once, before the event loop shuts down)"""
+    global _HTTPX_CLIENT, _AIOHTTP_SESSION
+    if _HTTPX_CLIENT is not None:
+        await _HTTPX_CLIENT.aclose()
+        _HTTPX_CLIENT = None
+    if _AIOHTTP_SESSION is not None:
+        await _AIOHTTP_SESSION.close()
+        _AIOHTTP_SESSION = None
+
+# One tuned dnspython resolver per nameserver set, shared by every DNSResolver
+_DNS_RESOLVERS: Dict[Tuple[str, ...], dns.asyncresolver.Resolver] = {}
+
+def shared_dns_resolver(nameservers: List[str] = None) -> dns.asyncresolver.Resolver:
+    """Resolver with short timeouts and a 1232-byte EDNS buffer (UDP first, TCP only on truncation)"""
+    key = tuple(nameservers or ())
+    resolver = _DNS_RESOLVERS.get(key)
+    if resolver is None:
+        # Skip reading resolv.conf when the servers are given explicitly
+        resolver = dns.asyncresolver.Resolver(configure=not key)
+        if key:
+            resolver.nameservers = list(key)
+            # Spread queries over every --dns-server instead of always asking the first one
+            resolver.rotate = len(key) > 1
+        # A dead resolver should cost one short retry, not the 5s default per attempt
+        resolver.timeout = 2
+        resolver.lifetime = 4
+        resolver.use_edns(0, 0, 1232)
+        _DNS_RESOLVERS[key] = resolver
+    return resolver
+
+# In-process c-ares lookups (aiodns) for the record types the scanner asks for;
+# anything else, or a missing/unsupported aiodns, goes through dnspython.
+_ARES_RDTYPES = {'A': 'addr', 'CNAME': 'cname', 'NS': 'nsdname'}
+_ARES_RESOLVERS: Dict[Tuple[str, ...], Any] = {}
+
+def _ares_resolver(nameservers: Tuple[str, ...]):
+    """aiodns resolver for this nameserver set, bound to the running event loop"""
+    loop = asyncio.get_running_loop()
+    resolver = _ARES_RESOLVERS.get(nameservers)
+    if resolver is None or resolver.loop is not loop:
+        resolver = aiodns.DNSResolver(nameservers=list(nameservers) or None, loop=loop, timeout=2, tries=2,
+                                      rotate=len(nameservers) > 1)
+        _ARES_RESOLVERS[nameservers] = resolver
+    return resolver
+
+def _ares_error(name: str, error: Exception) -> Exception:
+    """Translate an aiodns error into the dnspython exception callers already handle"""
+    code = error.args[0] if error.args else None
+    if code == aiodns.error.ARES_ENOTFOUND:
+        return dns.resolver.NXDOMAIN(qnames=[dns.name.from_text(name)])
+    if code == aiodns.error.ARES_ENODATA:
+        return dns.resolver.NoAnswer()
+    if code in (aiodns.error.ARES_ESERVFAIL, aiodns.error.ARES_EREFUSED, aiodns.error.ARES_ECONNREFUSED):
+        return dns.resolver.NoNameservers()
+    if code == aiodns.error.ARES_ETIMEOUT:
+        return dns.exception.Timeout()
+    return dns.exception.DNSException(str(error))
+
+async def _ares_query(nameservers: Tuple[str, ...], name: str, rdtype: str) -> Tuple[int, List[Any]]:
+    """Resolve name/rdtype with c-ares; returns (min TTL, dnspython rdata list), empty on NoAnswer"""
+    resolver = _ares_resolver(nameservers)
+    field_name = _ARES_RDTYPES[rdtype]
+    try:
+        result = await resolver.query_dns(name, rdtype)
+    except aiodns.error.DNSError as e:
+        if e.args and e.args[0] == aiodns.error.ARES_ENODATA:
+            return 0, []
+        raise _ares_error(name, e) from None
+    
+    # The answer section can also carry the CNAME chain leading to the records asked for
+    records = [rec for rec in result.answer if hasattr(rec.data, field_name)]
+    if not records:
+        return 0, []
+    rdatas = []
+    for rec in records:
+        value = getattr(rec.data, field_name)
+        if rdtype != 'A':
+            value = value.rstrip('.') + '.'
+        rdatas.append(dns.rdata.from_text('IN', rdtype, value))
+    return min(rec.ttl for rec in records), rdatas
+
+def _use_aiodns() -> bool:
+    """aiodns >= 3.3 (query_dns) on a platform where c-ares runs on the event loop"""
+    return AIODNS_AVAILABLE and sys.platform != 'win32' and hasattr(aiodns.DNSResolver, 'query_dns')
+
+# Wildcard probe results shared by every DNSResolver:
+# (domain, nameservers) -> (expires, is_wildcard, ips, cname targets)
+WILDCARD_CACHE_TTL = 300
+WILDCARD_IP_SAMPLES = 4
+_WILDCARD_CACHE: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, bool, FrozenSet[str], FrozenSet[str]]] = {}
 
 class DNSResolver:
-    """Enhanced DNS resolver with dig support and better caching"""
-    def __init__(self):
-        self.cache = {}
-        self.resolver = dns.asyncresolver.Resolver()
-        self.resolver.timeout = 5
-        self.resolver.lifetime = 5
-        self.dig_available = shutil.which('dig') is not None
-        
-        if not self.dig_available and not os.environ.get('SENTINEL_NO_WARN'):
-            if COLOR_AVAILABLE:
-                print(f"{Fore.YELLOW}[WARNING] dig command not found. CNAME resolution may be limited.")
-                print(f"[INFO] Install with: sudo apt-get install dnsutils{Style.RESET_ALL}")
+    """Async DNS resolver (c-ares via aiodns, dnspython fallback) with caching"""
+    def __init__(self, nameservers: List[str] = None):
+        # Answers are kept for an hour, empty results only briefly so late-created records are seen
+        self.cache = TTLCache(maxsize=100_000, ttl=3600)
+        self.neg_cache = TTLCache(maxsize=50_000, ttl=60)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.nameservers = tuple(nameservers or ())
+        self.resolver = shared_dns_resolver(nameservers)
+        self.use_aiodns = _use_aiodns()
+    
+    async def query(self, name: str, rdtype: str) -> List[Any]:
+        """Single DNS lookup returning rdata objects, served from the disk cache when fresh.
+        Network lookups are bounded by the scan-wide semaphore. A name without records of rdtype
+        (NoAnswer) yields an empty list; other errors propagate as dnspython exceptions."""
+        key = f"{rdtype}:{name.lower().rstrip('.')}"
+        if _DNS_CACHE is not None:
+            cached = _dns_cache_get(key, rdtype)
+            if cached is not None:
+                return cached
+        
+        async with network_slot():
+            if self.use_aiodns and rdtype in _ARES_RDTYPES:
+                ttl, rdatas = await _ares_query(self.nameservers, name, rdtype)
             else:
-                print("[WARNING] dig command not found. CNAME resolution may be limited.")
-                print("[INFO] Install with: sudo apt-get install dnsutils")
+                # An empty answer is common (most hosts have no CNAME), so skip building NoAnswer
+                answers = await self.resolver.resolve(name, rdtype, raise_on_no_answer=False)
+                if answers.rrset is None:
+                    return []
+                ttl = min((rrset.ttl for rrset in answers.response.answer), default=answers.rrset.ttl)
+                rdatas = list(answers)
+        
+        if _DNS_CACHE is not None and rdatas:
+            _dns_cache_put(key, ttl, rdatas)
+        return rdatas
     
-    async def resolve_cname(self, domain: str) -> Tuple[Optional[str], List[str]]:
-        """Resolve CNAME chain for domain using dig (more reliable)"""
-        cache_key = f"cname:{domain}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # Try using dig first (much more reliable for CNAME chains)
-        if self.dig_available:
-            try:
-                dig_result = await self._resolve_cname_with_dig(domain)
-                if dig_result[0]:  # If dig found something
-                    self.cache[cache_key] = dig_result
-                    return dig_result
-            except Exception as e:
-                if os.environ.get('SENTINEL_DEBUG'):
-                    print(f"[DNS-DEBUG] dig failed for {domain}: {e}")
-        
-        # Fallback to dnspython
+    async def _cached(self, cache_key: str, lookup, empty):
+        """Serve cache_key from the positive/negative caches, otherwise run lookup() once per key.
+        Concurrent callers for a key that is already being resolved await the same Future."""
+        for cache in (self.cache, self.neg_cache):
+            hit = cache.get(cache_key, _CACHE_MISS)
+            if hit is not _CACHE_MISS:
+                return hit
+        
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = fut
         try:
-            answers = await self.resolver.resolve(domain, 'CNAME')
-            cname = str(answers[0].target).rstrip('.')
-            chain = [cname]
-            
-            # Follow CNAME chain (max 5 hops to avoid loops)
-            for _ in range(5):
-                try:
-                    next_answers = await self.resolver.resolve(cname, 'CNAME')
-                    next_cname = str(next_answers[0].target).rstrip('.')
-                    if next_cname in chain:  # Avoid loops
-                        break
-                    chain.append(next_cname)
-                    cname = next_cname
-                except:
-                    break
-            
-            result = (chain[0], chain)
-            self.cache[cache_key] = result
+            result = await lookup()
+            if result == empty:
+                self.neg_cache[cache_key] = result
+            else:
+                self.cache[cache_key] = result
+            fut.set_result(result)
             return result
-        except Exception:
-            # Last resort: try direct socket lookup
-            try:
-                import socket
-                # socket.gethostbyname_ex returns (hostname, aliaslist, ipaddrlist)
-                result = socket.gethostbyname_ex(domain)
-                if result[1]:  # aliaslist contains CNAMEs
-                    cname = result[1][0]
-                    result = (cname, [cname])
-                    self.cache[cache_key] = result
-                    return result
-            except:
-                pass
-            
-            self.cache[cache_key] = (None, [])
-            return (None, [])
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            # Retrieve it so an unawaited Future does not log "exception was never retrieved"
+            fut.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+    
+    async def resolve_cname(self, domain: str) -> Tuple[Optional[str], List[str]]:
+        """Resolve the CNAME chain for domain (up to 5 hops)"""
+        return await self._cached(f"cname:{domain}", lambda: self._lookup_cname(domain), (None, []))
     
-    async def _resolve_cname_with_dig(self, domain: str) -> Tuple[Optional[str], List[str]]:
-        """Resolve CNAME using dig command - more reliable"""
+    async def _lookup_cname(self, domain: str) -> Tuple[Optional[str], List[str]]:
         try:
-            # Use dig with +trace for full resolution
-            cmd = ['dig', '+short', '+trace', 'CNAME', domain]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=15)
-            
-            if process.returncode == 0:
-                output = stdout.decode('utf-8', errors='ignore').strip()
-                if output:
-                    # Parse dig output for CNAME records
-                    lines = [line.strip() for line in output.split('\n') if line.strip()]
-                    cnames = []
-                    
-                    for line in lines:
-                        # Look for CNAME records in dig output
-                        if 'CNAME' in line.upper() or '.IN\tCNAME\t' in line:
-                            parts = line.split()
-                            for i, part in enumerate(parts):
-                                if part.upper() == 'CNAME':
-                                    if i + 1 < len(parts):
-                                        cname = parts[i + 1].rstrip('.')
-                                        cnames.append(cname)
-                                        break
-                    
-                    if cnames:
-                        # Remove duplicates while preserving order
-                        seen = set()
-                        unique_cnames = []
-                        for cname in cnames:
-                            if cname not in seen:
-                                seen.add(cname)
-                                unique_cnames.append(cname)
-                        
-                        return (unique_cnames[0], unique_cnames)
-            
-            # Try simple dig if trace fails
-            cmd_simple = ['dig', '+short', 'CNAME', domain]
-            process_simple = await asyncio.create_subprocess_exec(
-                *cmd_simple,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            answers = await self.query(domain, 'CNAME')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return (None, [])
+        except Exception:
+            # The DNS query itself failed (timeout, no reachable nameserver); ask the system resolver
+            result = await self._system_lookup(socket.gethostbyname_ex, domain)
+            # socket.gethostbyname_ex returns (hostname, aliaslist, ipaddrlist)
+            if result and result[1]:
+                cname = result[1][0].lower().rstrip('.')
+                return (cname, [cname])
+            return (None, [])
+        
+        # Chain links are stored canonical (lowercase, no trailing dot), so provider matching,
+        # loop detection and the NXDOMAIN cache all see one spelling per name
+        if answers:
+            cname = answers[0].target.to_text(omit_final_dot=True).lower()
+            chain = [cname]
             
-            stdout_simple, stderr_simple = await asyncio.wait_for(
-                process_simple.communicate(), 
-                timeout=5
-            )
+            # Follow CNAME chain (max 5 hops to avoid loops)
+            for _ in range(5):
+                try:
+                    next_answers = await self.query(cname, 'CNAME')
+                except:
+                    break
+                if not next_answers:
+                    break
+                next_cname = next_answers[0].target.to_text(omit_final_dot=True).lower()
+                if next_cname in chain:  # Avoid loops
+                    break
+                chain.append(next_cname)
+                cname = next_cname
             
-            if process_simple.returncode == 0:
-                output = stdout_simple.decode('utf-8', errors='ignore').strip()
-                if output:
-                    cname = output.split('\n')[0].strip().rstrip('.')
-                    # Try to follow CNAME chain
-                    chain = [cname]
-                    for _ in range(5):
-                        next_cname = await self._dig_cname_single(cname)
-                        if next_cname and next_cname != cname:
-                            chain.append(next_cname)
-                            cname = next_cname
-                        else:
-                            break
-                    return (chain[0], chain)
-                    
-        except asyncio.TimeoutError:
-            if os.environ.get('SENTINEL_DEBUG'):
-                print(f"[DNS-DEBUG] dig timeout for {domain}")
-        except Exception as e:
-            if os.environ.get('SENTINEL_DEBUG'):
-                print(f"[DNS-DEBUG] dig error for {domain}: {e}")
+            return (chain[0], chain)
         
         return (None, [])
     
-    async def _dig_cname_single(self, domain: str) -> Optional[str]:
-        """Get single CNAME using dig"""
-        try:
-            cmd = ['dig', '+short', 'CNAME', domain]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
-            
-            if process.returncode == 0:
-                output = stdout.decode('utf-8', errors='ignore').strip()
-                if output:
-                    return output.split('\n')[0].strip().rstrip('.')
-        except:
-            pass
-        return None
-    
     async def resolve_a(self, domain: str) -> List[str]:
-        """Resolve A records for domain with dig support"""
-        cache_key = f"a:{domain}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # Try dig first
-        if self.dig_available:
-            try:
-                dig_ips = await self._resolve_a_with_dig(domain)
-                if dig_ips:
-                    self.cache[cache_key] = dig_ips
-                    return dig_ips
-            except:
-                pass
-        
-        # Fallback to dnspython
+        """Resolve A records for domain"""
+        return await self._cached(f"a:{domain}", lambda: self._lookup_a(domain), [])
+    
+    async def _lookup_a(self, domain: str) -> List[str]:
         try:
-            answers = await self.resolver.resolve(domain, 'A')
-            result = [str(r) for r in answers]
-            self.cache[cache_key] = result
-            return result
+            answers = await self.query(domain, 'A')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return []
         except Exception:
-            # Last resort: try socket
-            try:
-                import socket
-                ip = socket.gethostbyname(domain)
-                result = [ip]
-                self.cache[cache_key] = result
-                return result
-            except:
-                self.cache[cache_key] = []
-                return []
+            # The DNS query itself failed (timeout, no reachable nameserver); ask the system resolver
+            ip = await self._system_lookup(socket.gethostbyname, domain)
+            return [ip] if ip else []
+        return [str(r) for r in answers]
     
-    async def _resolve_a_with_dig(self, domain: str) -> List[str]:
-        """Resolve A records using dig"""
+    async def _system_lookup(self, lookup, domain: str):
+        """Last-resort blocking socket lookup, run in a worker thread. Skipped when --dns-server
+        is set, since the system resolver would not ask those servers. None on failure."""
+        if self.nameservers:
+            return None
         try:
-            cmd = ['dig', '+short', 'A', domain]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
-            
-            if process.returncode == 0:
-                output = stdout.decode('utf-8', errors='ignore').strip()
-                if output:
-                    ips = []
-                    for line in output.split('\n'):
-                        ip = line.strip()
-                        # Validate IP address format
-                        if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$', ip):
-                            ips.append(ip)
-                    return ips
-        except:
-            pass
-        return []
+            return await asyncio.get_running_loop().run_in_executor(None, lookup, domain)
+        except OSError:
+            return None
     
     async def check_wildcard(self, domain: str) -> bool:
-        """Check if wildcard DNS is configured"""
-        random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=20))
-        test_domain = f"{random_str}.{domain}"
-        
+        """Check if wildcard DNS is configured (cached per domain and nameserver set)"""
+        key = (domain.lower(), self.nameservers)
+        cached = _WILDCARD_CACHE.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        # Two random labels from one draw; a wildcard answers both
+        labels = ''.join(random.choices(string.ascii_lowercase + string.digits, k=40))
+        test_domain = f"{labels[:20]}.{domain}"
+        test_domain2 = f"{labels[20:]}.{domain}"
+        
+        has_wildcard = False
+        ips = frozenset()
+        cnames = frozenset()
         try:
-            # Check both A and CNAME for wildcard
-            a_records = await self.resolve_a(test_domain)
-            cname, _ = await self.resolve_cname(test_domain)
+            # All four probes are independent, so resolve them concurrently
+            a_records, (cname, chain), a2, (cname2, chain2) = await asyncio.gather(
+                self.resolve_a(test_domain),
+                self.resolve_cname(test_domain),
+                self.resolve_a(test_domain2),
+                self.resolve_cname(test_domain2)
+            )
             
-            # If either exists, it's likely a wildcard
-            if len(a_records) > 0 or cname is not None:
-                # Double-check with another random domain
-                random_str2 = ''.join(random.choices(string.ascii_lowercase + string.digits, k=20))
-                test_domain2 = f"{random_str2}.{domain}"
-                a2 = await self.resolve_a(test_domain2)
-                cname2, _ = await self.resolve_cname(test_domain2)
-                
-                if len(a2) > 0 or cname2 is not None:
-                    return True
+            # Only a wildcard resolves both random names
+            if (a_records or cname is not None) and (a2 or cname2 is not None):
+                has_wildcard = True
+                ips = frozenset(a_records) | frozenset(a2)
+                # A CNAME wildcard hands every name the same target, and resolve_a follows it
+                cnames = frozenset(chain) | frozenset(chain2)
+                if ips:
+                    # Load-balanced wildcards rotate through a pool; sample a few more names
+                    # so brute-force hits answering from that pool can be recognised
+                    extra = ''.join(random.choices(string.ascii_lowercase + string.digits,
+                                                   k=20 * WILDCARD_IP_SAMPLES))
+                    samples = await asyncio.gather(*(
+                        self.resolve_a(f"{extra[i:i + 20]}.{domain}")
+                        for i in range(0, len(extra), 20)
+                    ))
+                    ips = ips.union(*samples)
         except:
             pass
         
-        return False
+        _WILDCARD_CACHE[key] = (time.monotonic() + WILDCARD_CACHE_TTL, has_wildcard, ips, cnames)
+        return has_wildcard
+    
+    def wildcard_ips(self, domain: str) -> FrozenSet[str]:
+        """A records the wildcard answered with during the last check_wildcard(domain)"""
+        cached = _WILDCARD_CACHE.get((domain.lower(), self.nameservers))
+        return cached[2] if cached is not None else frozenset()
+    
+    def wildcard_cnames(self, domain: str) -> FrozenSet[str]:
+        """CNAME targets the wildcard answered with during the last check_wildcard(domain)"""
+        cached = _WILDCARD_CACHE.get((domain.lower(), self.nameservers))
+        return cached[3] if cached is not None else frozenset()
+
 # ============================================================================
 # ENUMERATION ENGINE
 # ============================================================================
 
+def build_bruteforce_targets(domain: str, wordlist: List[str]) -> Tuple[str, ...]:
+    """Render every '<word>.<domain>' candidate once, dropping duplicate words in order"""
+    suffix = "." + domain
+    return tuple(word + suffix for word in dict.fromkeys(wordlist))
+
+def rank_wordlist_by_hits(wordlist: List[str], hit_labels: Iterable[str], min_prefix: int = 3) -> List[str]:
+    """Stable-sort words so those sharing a prefix of at least min_prefix characters with an
+    already seen label (dev -> dev2, staging -> stage) are probed first"""
+    trie: Dict[str, dict] = {}
+    for label in hit_labels:
+        node = trie
+        for ch in label:
+            node = node.setdefault(ch, {})
+    if not trie:
+        return list(wordlist)
+    
+    def shared_prefix(word: str) -> int:
+        node, depth = trie, 0
+        for ch in word:
+            node = node.get(ch)
+            if node is None:
+                break
+            depth += 1
+        return depth if depth >= min_prefix else 0
+    
+    return sorted(wordlist, key=lambda word: -shared_prefix(word))
+
 class SubdomainEnumerator:
     """Multi-source subdomain enumeration"""
     
-    def __init__(self, domain: str, rate_limiter: RateLimiter = None, enable_bruteforce: bool = False, wordlist: List[str] = None):
+    def __init__(self, domain: str, rate_limiter: RateLimiter = None, enable_bruteforce: bool = False, wordlist: List[str] = None,
+                 nameservers: List[str] = None, massdns_bin: str = None, resolvers_file: str = None, debug: bool = False,
+                 max_tasks: int = 512, session: ClientSession = None, max_hits: int = 0):
         self.domain = domain
         self.rate_limiter = rate_limiter or RateLimiter()
-        self.dns_resolver = DNSResolver()
+        self.nameservers = nameservers
+        self.massdns_bin = massdns_bin
+        self.resolvers_file = resolvers_file
+        self.debug = debug
+        self.dns_resolver = DNSResolver(nameservers)
+        # A caller-provided session is used as-is and stays open after the enumerator exits
+        self._injected_session = session
         self.session = None
         self.enable_bruteforce = enable_bruteforce
         self.wordlist = wordlist or COMMON_SUBDOMAINS
+        self.max_tasks = max_tasks
+        # Stop the built-in brute-force after this many hits (0 = probe the whole wordlist)
+        self.max_hits = max_hits
+        # The always-added common names are rendered once per enumerator
+        self._common_fqdns = frozenset(build_bruteforce_targets(domain, self.wordlist[:50]))
+        self._host_filter_re = build_host_filter_re([domain])
+        # Passive-source hosts must end with ".domain" (or be the domain) so lookalikes such as
+        # "notexample.com" are dropped as they are read, before normalize_subdomains
+        self._domain_suffix = "." + domain
+        self._exists_cache = TTLCache(maxsize=65536, ttl=300)
+        self._exists_inflight: Dict[Tuple[str, FrozenSet[str], FrozenSet[str]], asyncio.Future] = {}
+        self._crtsh_fallback_re = _body_re.compile(rb'[a-zA-Z0-9.-]+\.' + re.escape(domain.encode()))
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = self._injected_session or get_aiohttp(self.nameservers)
+        if self.debug:
+            loop = asyncio.get_running_loop()
+            ColorPrinter.print(f"Event loop: {type(loop).__module__}.{type(loop).__name__}", "debug")
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The session is never owned here: injected ones belong to the caller and the
+        # scan-wide one is closed by close_http_clients()
+        self.session = None
     
     async def enumerate_all(self, sources: List[str] = None) -> Set[str]:
         """Enumerate from all sources"""
@@ -1301,29 +2179,35 @@ class SubdomainEnumerator:
         
         if sources is None:
             sources = ["crt_sh", "omnisint", "hackertarget", "wayback"]
+            if self.enable_bruteforce:
+                sources.append("bruteforce")
         
         ColorPrinter.print(f"Starting enumeration from {len(sources)} sources", "info")
         
-        tasks = []
-        for source in sources:
-            if source == "crt_sh":
-                tasks.append(self.enumerate_crtsh())
-            elif source == "omnisint":
-                tasks.append(self.enumerate_omnisint())
-            elif source == "hackertarget":
-                tasks.append(self.enumerate_hackertarget())
-            elif source == "wayback":
-                tasks.append(self.enumerate_wayback())
-            elif source == "bruteforce" and self.enable_bruteforce:
-                tasks.append(self.enumerate_bruteforce())
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, set):
-                all_subs.update(result)
-            elif isinstance(result, Exception):
-                ColorPrinter.print(f"Enumeration error: {result}", "error")
+        source_methods = {
+            "crt_sh": self.enumerate_crtsh,
+            "omnisint": self.enumerate_omnisint,
+            "hackertarget": self.enumerate_hackertarget,
+            "wayback": self.enumerate_wayback,
+        }
+        
+        # Schedule each source as soon as it is picked, so the first requests are already
+        # connecting while the rest are being set up
+        tasks = [asyncio.create_task(source_methods[source]()) for source in sources if source in source_methods]
+        
+        # Merge each source as it finishes, while the slower ones are still downloading
+        for fut in asyncio.as_completed(tasks):
+            try:
+                all_subs.update(await fut)
+            except Exception as e:
+                ColorPrinter.print(f"Enumeration error: {e}", "error")
+        
+        # Brute-force runs last so the passive hits can decide which words are probed first
+        if self.enable_bruteforce and "bruteforce" in sources:
+            try:
+                all_subs.update(await self.enumerate_bruteforce(hints=all_subs))
+            except Exception as e:
+                ColorPrinter.print(f"Enumeration error: {e}", "error")
         
         all_subs.update(self.get_common_subdomains())
         normalized = self.normalize_subdomains(all_subs)
@@ -1334,7 +2218,10 @@ class SubdomainEnumerator:
     async def enumerate_crtsh(self) -> Set[str]:
         """Certificate Transparency enumeration with anti-blocking"""
         subs = set()
-        url = f"https://crt.sh/?q=%25.{self.domain}&output=json"
+        url = "https://crt.sh/"
+        # deduplicate=Y drops the precertificate/leaf duplicate of every issued cert. Expired certs
+        # are kept on purpose: they name the abandoned hosts most likely to be dangling.
+        params = {'q': f"%.{self.domain}", 'output': 'json', 'deduplicate': 'Y'}
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -1344,16 +2231,22 @@ class SubdomainEnumerator:
         }
         
         try:
-            await self.rate_limiter.wait()
-            async with self.session.get(url, timeout=15, headers=headers) as resp:
+            await self.rate_limiter.wait(urlparse(url).netloc)
+            async with network_slot(), self.session.get(url, params=params, timeout=15, headers=headers) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    for entry in data:
+                    # Entries are parsed as they stream in rather than after the full download.
+                    # The same SANs repeat across certificates, so raw lines are deduplicated
+                    # before any per-line string work.
+                    seen = set()
+                    async for entry in iter_json_array(resp):
                         name_value = entry.get('name_value', '')
                         if name_value:
-                            for line in name_value.split('\n'):
+                            for line in name_value.splitlines():
+                                if line in seen:
+                                    continue
+                                seen.add(line)
                                 line = line.strip().lower()
-                                if line and line.endswith(self.domain):
+                                if line.endswith(self._domain_suffix) or line == self.domain:
                                     subs.add(line)
                 elif resp.status == 403:
                     ColorPrinter.print("crt.sh blocked request (403). Try manually in browser.", "warning")
@@ -1363,13 +2256,12 @@ class SubdomainEnumerator:
             ColorPrinter.print(f"crt.sh error: {e}", "warning")
             
             try:
-                alt_url = f"https://crt.sh/?q={self.domain}&output=json"
-                async with self.session.get(alt_url, timeout=10) as resp2:
+                alt_url = f"https://crt.sh/?q={self.domain}&output=json&deduplicate=Y"
+                async with network_slot(), self.session.get(alt_url, timeout=10) as resp2:
                     if resp2.status == 200:
-                        text = await resp2.text()
-                        import re
-                        found_subs = re.findall(r'[a-zA-Z0-9.-]+\.' + re.escape(self.domain), text)
-                        subs.update([s.lower() for s in found_subs])
+                        # Scan the raw bytes; only the matches are decoded
+                        found_subs = self._crtsh_fallback_re.findall(await resp2.read())
+                        subs.update(s.decode('ascii', 'ignore').lower() for s in found_subs)
             except:
                 pass
         
@@ -1381,10 +2273,10 @@ class SubdomainEnumerator:
         url = f"https://sonar.omnisint.io/subdomains/{self.domain}"
         
         try:
-            await self.rate_limiter.wait()
-            async with self.session.get(url, timeout=10) as resp:
+            await self.rate_limiter.wait(urlparse(url).netloc)
+            async with network_slot(), self.session.get(url, timeout=10) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await json_loads_async(await resp.read())
                     if isinstance(data, list):
                         for sub in data:
                             full = f"{sub}.{self.domain}"
@@ -1400,15 +2292,20 @@ class SubdomainEnumerator:
         url = f"http://web.archive.org/cdx/search/cdx?url=*.{self.domain}/*&output=json&fl=original&collapse=urlkey"
         
         try:
-            await self.rate_limiter.wait()
-            async with self.session.get(url, timeout=15) as resp:
+            await self.rate_limiter.wait(urlparse(url).netloc)
+            async with network_slot(), self.session.get(url, timeout=15) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    for row in data[1:]:
-                        if row and row[0]:
-                            parsed = urlparse(row[0])
-                            if parsed.netloc.endswith(self.domain):
-                                subs.add(parsed.netloc.lower())
+                    header = True
+                    async for row in iter_json_array(resp):
+                        # The first row is the CDX field header
+                        if header:
+                            header = False
+                            continue
+                        m = URL_HOST_RE.match(row[0]) if row and row[0] else None
+                        if m:
+                            host = m.group(1).lower()
+                            if host.endswith(self._domain_suffix) or host == self.domain:
+                                subs.add(host)
         except Exception as e:
             ColorPrinter.print(f"Wayback error: {e}", "warning")
         
@@ -1420,142 +2317,246 @@ class SubdomainEnumerator:
         url = f"https://api.hackertarget.com/hostsearch/?q={self.domain}"
         
         try:
-            await self.rate_limiter.wait()
-            async with self.session.get(url, timeout=10) as resp:
+            await self.rate_limiter.wait(urlparse(url).netloc)
+            async with network_slot(), self.session.get(url, timeout=10) as resp:
                 if resp.status == 200:
-                    text = await resp.text()
-                    for line in text.splitlines():
-                        if ',' in line:
-                            sub = line.split(',')[0].strip().lower()
-                            if sub.endswith(self.domain):
-                                subs.add(sub)
+                    seen = set()
+                    async for line in iter_lines(resp):
+                        host, sep, _ = line.partition(b',')
+                        if not sep or host in seen:
+                            continue
+                        seen.add(host)
+                        sub = host.strip().lower().decode('utf-8', 'ignore')
+                        if sub.endswith(self._domain_suffix) or sub == self.domain:
+                            subs.add(sub)
         except Exception as e:
             ColorPrinter.print(f"HackerTarget error: {e}", "warning")
         
         return subs
     
-    async def enumerate_bruteforce(self, wordlist: List[str] = None) -> Set[str]:
-        """DNS bruteforce enumeration"""
+    async def enumerate_bruteforce(self, wordlist: List[str] = None, hints: Set[str] = None) -> Set[str]:
+        """DNS bruteforce enumeration. Words resembling the first label of a hint
+        (already discovered names) are probed first."""
         subs = set()
         
-        if wordlist is None:
-            wordlist = self.wordlist
-        
-        ColorPrinter.print(f"Starting brute-force with {len(wordlist)} words...", "info")
+        words = wordlist or self.wordlist
+        if hints:
+            words = rank_wordlist_by_hits(words, {sub.split('.', 1)[0] for sub in hints})
+        targets = build_bruteforce_targets(self.domain, words)
+        ColorPrinter.print(f"Starting brute-force with {len(targets)} words...", "info")
         
         # Check for wildcard DNS first
         has_wildcard = await self.dns_resolver.check_wildcard(self.domain)
+        wildcard_ips = wildcard_cnames = frozenset()
         if has_wildcard:
             ColorPrinter.print("Warning: Wildcard DNS detected, brute-force may produce false positives", "warning")
-        
-        # Batch process for efficiency
-        batch_size = 50
-        for i in range(0, len(wordlist), batch_size):
-            batch = wordlist[i:i+batch_size]
-            
-            tasks = []
-            for word in batch:
-                subdomain = f"{word}.{self.domain}"
-                tasks.append(self.check_subdomain_exists(subdomain))
-            
-            results = await asyncio.gather(*tasks)
-            
-            for j, exists in enumerate(results):
-                if exists:
-                    sub = f"{batch[j]}.{self.domain}"
-                    subs.add(sub)
-                    if len(subs) % 10 == 0:
-                        print(f"[BRUTEFORCE] Found {len(subs)} so far...", end='\r')
+            wildcard_ips = self.dns_resolver.wildcard_ips(self.domain)
+            wildcard_cnames = self.dns_resolver.wildcard_cnames(self.domain)
+        
+        # Hand large wordlists to massdns when available; small ones resolve faster in process
+        if self.massdns_bin and len(targets) >= MASSDNS_MIN_TARGETS:
+            resolved = await MassdnsIntegration.resolve(
+                hostnames=targets,
+                binary_path=self.massdns_bin,
+                resolvers_file=self.resolvers_file,
+                nameservers=self.nameservers,
+                debug=self.debug,
+                wildcard_ips=wildcard_ips,
+                wildcard_cnames=wildcard_cnames
+            )
+            if resolved is not None:
+                if self.max_hits and len(resolved) > self.max_hits:
+                    # Keep the hits the in-process path would have reached first: targets are ranked
+                    resolved = set(itertools.islice((name for name in targets if name in resolved), self.max_hits))
+                    ColorPrinter.print(f"Brute-force stopped after reaching --max-hits {self.max_hits}", "info")
+                print(f"[BRUTEFORCE] Found {len(resolved)} subdomains (massdns)")
+                return resolved
+            ColorPrinter.print("massdns failed, falling back to built-in resolver", "warning")
+        
+        # max_tasks workers pull candidates from one iterator, so a probe starts as soon as any
+        # finishes and only max_tasks coroutines exist however long the wordlist is
+        pending = iter(targets)
+        workers = []
+        
+        async def worker():
+            for subdomain in pending:
+                try:
+                    exists = await self.check_subdomain_exists(subdomain, wildcard_ips, wildcard_cnames)
+                except Exception:
+                    continue
+                if not exists:
+                    continue
+                subs.add(subdomain)
+                if len(subs) % 10 == 0:
+                    print(f"[BRUTEFORCE] Found {len(subs)} so far...", end='\r')
+                if self.max_hits and len(subs) >= self.max_hits:
+                    ColorPrinter.print(f"Brute-force stopped after reaching --max-hits {self.max_hits}", "info")
+                    # Drop the probes still in flight; none of them can add another hit
+                    current = asyncio.current_task()
+                    for other in workers:
+                        if other is not current:
+                            other.cancel()
+                    return
+        
+        workers.extend(asyncio.ensure_future(worker()) for _ in range(max(1, min(self.max_tasks, len(targets)))))
+        try:
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            for task in workers:
+                task.cancel()
         
         if subs:
             print(f"\n[BRUTEFORCE] Found {len(subs)} subdomains")
         
         return subs
     
-    async def check_subdomain_exists(self, subdomain: str) -> bool:
-        """Check if subdomain exists via DNS"""
+    async def check_subdomain_exists(self, subdomain: str, wildcard_ips: FrozenSet[str] = frozenset(),
+                                     wildcard_cnames: FrozenSet[str] = frozenset()) -> bool:
+        """Check if subdomain exists via DNS. A records that only repeat the parent's
+        wildcard answer (wildcard_ips), or a CNAME to the wildcard's target (wildcard_cnames),
+        do not count. Repeat and concurrent checks of the same name share one answer."""
+        key = (subdomain.lower(), wildcard_ips, wildcard_cnames)
+        cached = self._exists_cache.get(key)
+        if cached is not None:
+            return cached
+        pending = self._exists_inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._exists_inflight[key] = fut
         try:
-            a_records = await self.dns_resolver.resolve_a(subdomain)
-            if a_records:
-                return True
-            
-            cname, _ = await self.dns_resolver.resolve_cname(subdomain)
-            if cname:
-                return True
-        except Exception:
-            pass
+            exists = await self._probe_exists(subdomain, wildcard_ips, wildcard_cnames)
+            self._exists_cache[key] = exists
+            fut.set_result(exists)
+            return exists
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()
+            raise
+        finally:
+            self._exists_inflight.pop(key, None)
+    
+    async def _probe_exists(self, subdomain: str, wildcard_ips: FrozenSet[str], wildcard_cnames: FrozenSet[str]) -> bool:
+        # A and CNAME go out together, so a missing name costs one round trip instead of two
+        a_records, cname_result = await asyncio.gather(
+            self.dns_resolver.resolve_a(subdomain),
+            self.dns_resolver.resolve_cname(subdomain),
+            return_exceptions=True
+        )
         
+        if isinstance(a_records, list) and a_records and not (wildcard_ips and wildcard_ips.issuperset(a_records)):
+            return True
+        if isinstance(cname_result, tuple) and cname_result[0] and cname_result[0] not in wildcard_cnames:
+            return True
         return False
     
-    def get_common_subdomains(self) -> Set[str]:
+    def get_common_subdomains(self) -> FrozenSet[str]:
         """Get common subdomains"""
-        common = self.wordlist[:50]  # Use first 50 from wordlist
-        return {f"{sub}.{self.domain}" for sub in common}
+        return self._common_fqdns  # First 50 from wordlist
     
     def normalize_subdomains(self, subdomains: Set[str]) -> Set[str]:
         """Normalize and filter subdomains"""
-        normalized = set()
-        for sub in subdomains:
-            sub = sub.strip().lower()
-            if sub.startswith(('http://', 'https://')):
-                sub = sub.split('://')[1]
-            sub = sub.split(':')[0]
-            sub = sub.split('/')[0]
-            sub = sub.rstrip('.')
-            
-            if sub.endswith(self.domain):
-                normalized.add(sub)
-        
-        return normalized
+        # A single C-level scan over all candidates instead of per-string parsing in Python
+        hosts = self._host_filter_re.findall("\n".join(subdomains))
+        return {host.lower() for host in hosts}
 
 # ============================================================================
 # TAKEOVER DETECTION ENGINE
 # ============================================================================
 
+# A NoNameservers verdict is re-queried this many times, pausing a little longer each time
+NO_NAMESERVERS_RETRIES = 1
+NO_NAMESERVERS_RETRY_DELAY = 0.5
+
 class TakeoverDetector:
     """Main takeover detection logic with NXDOMAIN checks and zero false positives"""
     
     def __init__(self, domain: str, args):
         self.domain = domain
         self.args = args
-        self.dns_resolver = DNSResolver()
-        self.rate_limiter = RateLimiter(calls_per_second=20)
+        self.dns_resolver = DNSResolver(getattr(args, 'dns_servers', None))
+        # Paces requests to each probed host; fan-out is bounded by --threads and --max-inflight
+        self.rate_limiter = RateLimiter(calls_per_second=getattr(args, 'rate_limit', 10))
         self.wildcard_cache = {}
-        self._wildcard_checked = False
-        self._has_wildcard = False
+        self._wildcard_task: Optional[asyncio.Future] = None
+        # CNAME targets and nameservers repeat across subdomains (*.cloudfront.net, shared NS sets)
+        self._nx_cache = TTLCache(maxsize=65536, ttl=300)
+        self._nx_inflight: Dict[str, asyncio.Future] = {}
+        # Certificates are inspected, not verified, so one context without a trust store serves every probe
+        self._ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        self._ssl_ctx.check_hostname = False
+        self._ssl_ctx.verify_mode = ssl.CERT_NONE
+        # CNAME targets / IPs whose port 443 refused or timed out; names behind them skip the probe
+        self._tls_unreachable = TTLCache(maxsize=16384, ttl=300)
     
     async def check_cname_nxdomain(self, cname: str) -> bool:
-        """Check if CNAME target returns NXDOMAIN (strongest takeover signal)"""
+        """Check if CNAME target returns NXDOMAIN (strongest takeover signal).
+        Each name is resolved once per scan window, concurrent checks share the lookup."""
+        key = cname.lower().rstrip('.')
+        cached = self._nx_cache.get(key)
+        if cached is not None:
+            return cached
+        pending = self._nx_inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._nx_inflight[key] = fut
         try:
-            await self.dns_resolver.resolver.resolve(cname, 'A')
-            return False
-        except dns.resolver.NXDOMAIN:
-            return True
-        except dns.resolver.NoAnswer:
-            return False
-        except dns.resolver.NoNameservers:
-            return True  # No nameservers is also a strong signal
-        except Exception:
-            return False
+            is_nx = await self._probe_nxdomain(cname)
+            self._nx_cache[key] = is_nx
+            fut.set_result(is_nx)
+            return is_nx
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        finally:
+            self._nx_inflight.pop(key, None)
+    
+    async def _probe_nxdomain(self, cname: str) -> bool:
+        for attempt in range(NO_NAMESERVERS_RETRIES + 1):
+            try:
+                await self.dns_resolver.query(cname, 'A')
+                return False
+            except dns.resolver.NXDOMAIN:
+                return True
+            except dns.resolver.NoAnswer:
+                return False
+            except dns.resolver.NoNameservers:
+                # No nameservers is also a strong signal, but a throttling resolver answers
+                # SERVFAIL/REFUSED too, so only a repeat after a pause counts
+                if attempt == NO_NAMESERVERS_RETRIES:
+                    return True
+                await asyncio.sleep(NO_NAMESERVERS_RETRY_DELAY * (attempt + 1))
+            except Exception:
+                return False
+        return True
     
     async def check_wildcard_domain(self) -> bool:
         """Check once if the target domain has wildcard DNS"""
-        if self._wildcard_checked:
-            return self._has_wildcard
-        self._wildcard_checked = True
-        self._has_wildcard = await self.dns_resolver.check_wildcard(self.domain)
-        if self._has_wildcard and self.args.debug:
+        # Subdomains are analyzed concurrently: they all await the one detection, and shield()
+        # keeps a cancelled analysis from cancelling it for the rest
+        if self._wildcard_task is None:
+            self._wildcard_task = asyncio.ensure_future(self._detect_wildcard())
+        return await asyncio.shield(self._wildcard_task)
+    
+    async def _detect_wildcard(self) -> bool:
+        has_wildcard = await self.dns_resolver.check_wildcard(self.domain)
+        if has_wildcard and self.args.debug:
             ColorPrinter.print(f"Wildcard DNS detected for {self.domain}, reducing confidence scores", "warning")
-        return self._has_wildcard
+        return has_wildcard
     
     async def check_ns_takeover(self, subdomain: str) -> Tuple[bool, List[str], List[str]]:
         """Check if NS records for subdomain delegate to dead nameservers.
         Returns (is_vulnerable, ns_records, dead_ns_list)"""
         ns_records = []
-        dead_ns = []
         try:
-            answers = await self.dns_resolver.resolver.resolve(subdomain, 'NS')
-            ns_records = [str(r.target).rstrip('.') for r in answers]
+            answers = await self.dns_resolver.query(subdomain, 'NS')
+            ns_records = [r.target.to_text(omit_final_dot=True) for r in answers]
         except dns.resolver.NoAnswer:
             return False, [], []
         except dns.resolver.NXDOMAIN:
@@ -1563,121 +2564,91 @@ class TakeoverDetector:
         except Exception:
             return False, [], []
         
-        for ns in ns_records:
-            try:
-                await self.dns_resolver.resolver.resolve(ns, 'A')
-            except dns.resolver.NXDOMAIN:
-                dead_ns.append(ns)
-            except dns.resolver.NoNameservers:
-                dead_ns.append(ns)
-            except Exception:
-                pass
+        # Same A-lookup verdict as a CNAME target, so nameservers share the NXDOMAIN cache.
+        # All nameservers are checked at once; query() holds a scan-wide network slot for each.
+        flags = await asyncio.gather(*(self.check_cname_nxdomain(ns) for ns in ns_records))
+        dead_ns = [ns for ns, is_nx in zip(ns_records, flags) if is_nx]
         
         return len(dead_ns) > 0, ns_records, dead_ns
     
     async def check_chain_nxdomain(self, cname_chain: List[str]) -> List[str]:
         """Walk entire CNAME chain and return any dangling (NXDOMAIN) links"""
-        dangling = []
-        for link in cname_chain:
-            is_nx = await self.check_cname_nxdomain(link)
-            if is_nx:
-                dangling.append(link)
-        return dangling
-    
-    async def check_ssl_mismatch(self, subdomain: str) -> Tuple[bool, Optional[str]]:
-        """Check if SSL cert doesn't match the subdomain (misconfigured resource)"""
+        # Links are checked concurrently, so the chain costs one round trip instead of one per hop
+        flags = await asyncio.gather(*(self.check_cname_nxdomain(link) for link in cname_chain))
+        return [link for link, is_nx in zip(cname_chain, flags) if is_nx]
+    
+    async def check_ssl_mismatch(self, subdomain: str, target: str = None) -> Tuple[bool, Optional[str]]:
+        """Check if SSL cert doesn't match the subdomain (misconfigured resource).
+        target is what subdomain resolves through (CNAME target or A record); once it is known
+        to refuse or time out on port 443, other subdomains behind it are not probed again."""
+        if target and self._tls_unreachable.get(target):
+            return False, None
+        loop = asyncio.get_running_loop()
+        transport = None
         try:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            loop = asyncio.get_event_loop()
-            # Use a timeout for the SSL connection
-            conn = asyncio.open_connection(subdomain, 443, ssl=ctx)
-            reader, writer = await asyncio.wait_for(conn, timeout=5.0)
+            async with network_slot():
+                try:
+                    # TCP connect gets its own deadline, so blackholed hosts fail fast
+                    transport, protocol = await asyncio.wait_for(
+                        loop.create_connection(asyncio.Protocol, subdomain, 443), timeout=TLS_CONNECT_TIMEOUT)
+                except (ConnectionRefusedError, asyncio.TimeoutError):
+                    # TCP reachability does not depend on SNI, unlike the certificate served, so
+                    # only this outcome is shared across names
+                    if target:
+                        self._tls_unreachable[target] = True
+                    raise
+                # Only the certificate is needed, so a bare transport replaces StreamReader/Writer
+                transport = await loop.start_tls(transport, protocol, self._ssl_ctx, server_hostname=subdomain,
+                                                 ssl_handshake_timeout=TLS_HANDSHAKE_TIMEOUT)
             
             # Get the SSL object from the transport
-            ssl_obj = writer.transport.get_extra_info('ssl_object')
-            if ssl_obj:
-                cert = ssl_obj.getpeercert(binary_form=True)
-                if cert:
-                    import ssl as ssl_mod
-                    decoded = ssl_mod.DER_cert_to_PEM_cert(cert)
-                    # Try to get peercert dict
-                    try:
-                        cert_dict = ssl_obj.getpeercert()
-                        if cert_dict:
-                            cn = ''
-                            sans = []
-                            # Extract CN
-                            for rdn in cert_dict.get('subject', ()):
-                                for attr, value in rdn:
-                                    if attr == 'commonName':
-                                        cn = value
-                            # Extract SANs
-                            for san_type, san_value in cert_dict.get('subjectAltName', ()):
-                                if san_type == 'DNS':
-                                    sans.append(san_value)
-                            
-                            # Check if subdomain matches CN or any SAN
-                            all_names = sans + ([cn] if cn else [])
-                            matches = False
-                            for name in all_names:
-                                if name.startswith('*.'):
-                                    # Wildcard match
-                                    wildcard_base = name[2:]
-                                    if subdomain.endswith(wildcard_base):
-                                        matches = True
-                                        break
-                                elif subdomain == name:
-                                    matches = True
-                                    break
-                            
-                            writer.close()
-                            try:
-                                await writer.wait_closed()
-                            except:
-                                pass
-                            return not matches, cn
-                    except:
-                        pass
-            
-            writer.close()
-            try:
-                await writer.wait_closed()
-            except:
-                pass
+            ssl_obj = transport.get_extra_info('ssl_object')
+            cert_dict = ssl_obj.getpeercert() if ssl_obj and ssl_obj.getpeercert(binary_form=True) else None
+            if cert_dict:
+                cn = ''
+                sans = []
+                # Extract CN
+                for rdn in cert_dict.get('subject', ()):
+                    for attr, value in rdn:
+                        if attr == 'commonName':
+                            cn = value
+                # Extract SANs
+                for san_type, san_value in cert_dict.get('subjectAltName', ()):
+                    if san_type == 'DNS':
+                        sans.append(san_value)
+                
+                # Check if subdomain matches CN or any SAN
+                all_names = {name.lower() for name in sans + ([cn] if cn else [])}
+                wildcard_parents = {name[2:] for name in all_names if name.startswith('*.')}
+                host = subdomain.lower()
+                # A wildcard covers exactly one label: *.foo.bar matches a.foo.bar, not a.b.foo.bar
+                matches = host in all_names or host.partition('.')[2] in wildcard_parents
+                return not matches, cn
         except Exception:
             pass
+        finally:
+            if transport is not None:
+                transport.close()
         return False, None
     
     def check_response_headers(self, headers: dict) -> Optional[str]:
         """Identify provider from HTTP response headers"""
-        if not headers:
+        matched = match_headers(headers)
+        if not matched:
             return None
         
-        for provider, fingerprint in HEADER_FINGERPRINTS.items():
-            match_count = 0
-            total = len(fingerprint)
-            for header_name, expected_value in fingerprint.items():
-                actual = headers.get(header_name, '')
-                if actual and (not expected_value or expected_value in actual):
-                    match_count += 1
-            if match_count == total and total > 0:
+        # Keep HEADER_FINGERPRINTS order as the tie-breaker
+        for provider in HEADER_FINGERPRINTS:
+            if provider in matched:
                 return provider
         return None
     
     def check_dangling_a_record(self, a_records: List[str]) -> Tuple[bool, Optional[str]]:
         """Check if A records point to known cloud provider IP ranges"""
         for ip_str in a_records:
-            try:
-                ip = ipaddress.ip_address(ip_str)
-                for provider, ranges in CLOUD_IP_RANGES.items():
-                    for cidr in ranges:
-                        if ip in ipaddress.ip_network(cidr, strict=False):
-                            return True, provider
-            except (ValueError, TypeError):
-                continue
+            provider = classify_ip(ip_str)
+            if provider:
+                return True, provider
         return False, None
     
     async def analyze_subdomain(self, subdomain: str) -> SubdomainFinding:
@@ -1692,43 +2663,65 @@ class TakeoverDetector:
             finding.a_records = dns_info['a_records']
             finding.provider = dns_info['provider']
             
-            # Step 2: NS Delegation Check (independent of CNAME)
-            ns_vuln, ns_records, dead_ns = await self.check_ns_takeover(subdomain)
-            finding.ns_records = ns_records
-            finding.ns_takeover = ns_vuln
-            if ns_vuln:
-                finding.evidence.append(f"🔴 NS TAKEOVER: Dead nameservers detected: {', '.join(dead_ns)}")
+            # Steps 2-8 only depend on the DNS answer, so their lookups and probes run concurrently
+            probes: Dict[str, asyncio.Future] = {}
+            # The chain starts with the CNAME target, so one walk answers both Step 4 and Step 5
+            cname_links = finding.cname_chain or ([finding.cname] if finding.cname else [])
+            
+            def start_probes():
+                if cname_links:
+                    probes['chain'] = asyncio.ensure_future(self.check_chain_nxdomain(cname_links))
+                probes['http'] = asyncio.ensure_future(self.analyze_http(subdomain))
+                tls_target = finding.cname or (finding.a_records[0] if finding.a_records else None)
+                probes['ssl'] = asyncio.ensure_future(self.check_ssl_mismatch(subdomain, tls_target))
+                probes['wildcard'] = asyncio.ensure_future(self.check_wildcard_domain())
             
-            # Step 3: Dangling A-Record Check (independent of CNAME)
+            # Step 3 is a local range lookup, and decides whether the probes are needed at all
+            is_dangling, cloud_provider = False, None
             if finding.a_records and not finding.cname:
                 is_dangling, cloud_provider = self.check_dangling_a_record(finding.a_records)
+            needs_probes = bool(finding.provider or finding.cname or is_dangling)
+            
+            ns_task = asyncio.ensure_future(self.check_ns_takeover(subdomain))
+            if needs_probes:
+                start_probes()
+            try:
+                # Step 2: NS Delegation Check (independent of CNAME)
+                ns_vuln, ns_records, dead_ns = await ns_task
+                finding.ns_records = ns_records
+                finding.ns_takeover = ns_vuln
+                if ns_vuln:
+                    finding.evidence.append(f"🔴 NS TAKEOVER: Dead nameservers detected: {', '.join(dead_ns)}")
+                
+                # Step 3: Dangling A-Record Check (independent of CNAME)
                 finding.dangling_a_record = is_dangling
                 if is_dangling:
                     finding.evidence.append(f"⚠️ A-record points to {cloud_provider} IP range — check if IP is still allocated")
+                
+                # If no CNAME/provider AND no NS takeover AND no dangling A, mark safe and skip
+                if not needs_probes:
+                    if not ns_vuln:
+                        finding.takeover_status = TakeoverStatus.SAFE
+                        finding.evidence.append("No CNAME, NS delegation, or dangling A-record detected")
+                        return finding
+                    start_probes()
+                
+                # Step 4: NXDOMAIN Check on CNAME target (strongest signal)
+                # Step 5: Second-order CNAME chain walk (only scored for chains of 2+ links)
+                # Steps 4-5 are reported once, by validate_takeover, next to their score
+                dangling_links = await probes['chain'] if 'chain' in probes else []
+                nxdomain = finding.cname in dangling_links
+                chain_dangling = dangling_links if len(cname_links) > 1 else []
+                
+                # Step 6: HTTP Analysis with httpx
+                http_info = await probes['http']
+                # Step 8 result is collected here too; it is reported after the header check below
+                ssl_mismatch, ssl_cn = await probes['ssl']
+                await probes['wildcard']
+            finally:
+                for task in (ns_task, *probes.values()):
+                    task.cancel()
             
-            # If no CNAME/provider AND no NS takeover AND no dangling A, mark safe and skip
-            if not finding.provider and not finding.cname and not ns_vuln and not finding.dangling_a_record:
-                finding.takeover_status = TakeoverStatus.SAFE
-                finding.evidence.append("No CNAME, NS delegation, or dangling A-record detected")
-                return finding
-            
-            # Step 4: NXDOMAIN Check on CNAME target (strongest signal)
-            nxdomain = False
-            if finding.cname:
-                nxdomain = await self.check_cname_nxdomain(finding.cname)
-                if nxdomain:
-                    finding.evidence.append(f"CRITICAL: CNAME target '{finding.cname}' returns NXDOMAIN")
-            
-            # Step 5: Second-order CNAME chain walk
-            chain_dangling = []
-            if finding.cname_chain and len(finding.cname_chain) > 1:
-                chain_dangling = await self.check_chain_nxdomain(finding.cname_chain)
-                for link in chain_dangling:
-                    if link != finding.cname:  # Avoid duplicate with step 4
-                        finding.evidence.append(f"🔴 CHAIN: Intermediate CNAME '{link}' returns NXDOMAIN")
-            
-            # Step 6: HTTP Analysis with httpx
-            http_info = await self.analyze_http(subdomain)
             finding.http_status = http_info.get('http_status')
             finding.https_status = http_info.get('https_status')
             finding.response_body = http_info.get('body', '')
@@ -1749,7 +2742,6 @@ class TakeoverDetector:
                     finding.evidence.append(f"Header fingerprint ({header_provider}) differs from CNAME provider ({finding.provider})")
             
             # Step 8: SSL Certificate Mismatch
-            ssl_mismatch, ssl_cn = await self.check_ssl_mismatch(subdomain)
             finding.ssl_mismatch = ssl_mismatch
             finding.ssl_cert_cn = ssl_cn
             if ssl_mismatch and ssl_cn:
@@ -1801,13 +2793,13 @@ class TakeoverDetector:
         }
         
         try:
-            # Get CNAME chain
-            cname, chain = await self.dns_resolver.resolve_cname(subdomain)
+            # CNAME chain and A records are independent lookups, so both go out at once
+            (cname, chain), a_records = await asyncio.gather(
+                self.dns_resolver.resolve_cname(subdomain),
+                self.dns_resolver.resolve_a(subdomain)
+            )
             result['cname'] = cname
             result['cname_chain'] = chain
-            
-            # Get A records
-            a_records = await self.dns_resolver.resolve_a(subdomain)
             result['a_records'] = a_records
             
             # Identify provider from CNAME chain
@@ -1824,19 +2816,15 @@ class TakeoverDetector:
         if not cname:
             return None
         
-        cname_lower = cname.lower()
-        for provider, config in PROVIDER_CONFIGS.items():
-            for pattern in config['cname_patterns']:
-                if pattern.lower() in cname_lower:
-                    return provider
+        provider = match_cname(cname)
+        if provider:
+            return provider
         
         # Also check chain
         for link in chain:
-            link_lower = link.lower()
-            for provider, config in PROVIDER_CONFIGS.items():
-                for pattern in config['cname_patterns']:
-                    if pattern.lower() in link_lower:
-                        return provider
+            provider = match_cname(link)
+            if provider:
+                return provider
         
         return None
     
@@ -1851,6 +2839,7 @@ class TakeoverDetector:
             'final_url': '',
             'is_live': False,
             'headers': {},
+            'body_hits': {},
             'errors': []
         }
         
@@ -1860,51 +2849,50 @@ class TakeoverDetector:
         ]
         
         http_timeout = getattr(self.args, 'timeout', 10)
-        timeout = Timeout(float(http_timeout), connect=5.0)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
         
         try:
-            async with AsyncClient(timeout=timeout, follow_redirects=True, verify=False) as client:
-                for url in urls_to_try:
-                    try:
-                        await self.rate_limiter.wait()
-                        start_time = time.time()
-                        resp = await client.get(url, headers=headers)
-                        response_time = time.time() - start_time
-                        
-                        status_code = resp.status_code
-                        final_url = str(resp.url)
-                        body = resp.text[:5000]  # Limit body size
-                        
-                        # Extract title
-                        title_match = re.search(r'<title>(.*?)</title>', body, re.IGNORECASE)
-                        page_title = title_match.group(1).strip()[:100] if title_match else ""
-                        
-                        if url.startswith('https://'):
-                            result['https_status'] = status_code
-                        else:
-                            result['http_status'] = status_code
-                        
-                        result['final_url'] = final_url
-                        result['body'] = body
-                        result['page_title'] = page_title
-                        result['response_time'] = response_time
-                        result['is_live'] = True
-                        
-                        # Capture response headers for fingerprinting
-                        result['headers'] = dict(resp.headers)
+            client = get_httpx(http_timeout)
+            for url in urls_to_try:
+                try:
+                    await self.rate_limiter.wait(subdomain)
+                    start_time = time.time()
+                    async with network_slot():
+                        async with client.stream('GET', url) as resp:
+                            raw_body = await read_body_prefix(resp)
+                    response_time = time.time() - start_time
+                    
+                    status_code = resp.status_code
+                    final_url = str(resp.url)
+                    encoding = body_encoding(resp.charset_encoding)
+                    body = raw_body.decode(encoding, errors='replace')[:HTTP_BODY_CHARS]
+                    
+                    # Extract title
+                    title_match = TITLE_RE.search(body)
+                    page_title = " ".join(title_match.group(1).split())[:100] if title_match else ""
+                    
+                    if url.startswith('https://'):
+                        result['https_status'] = status_code
+                    else:
+                        result['http_status'] = status_code
+                    
+                    result['final_url'] = final_url
+                    result['body'] = body
+                    # Provider pattern scan runs once here; validate_takeover reuses the hits
+                    result['body_hits'] = scan_body_cached((body_fingerprint(raw_body), encoding), body)
+                    result['page_title'] = page_title
+                    result['response_time'] = response_time
+                    result['is_live'] = True
+                    
+                    # Capture response headers for fingerprinting
+                    result['headers'] = dict(resp.headers)
+                    
+                    # Break if we got a successful response
+                    if status_code < 400:
+                        break
                         
-                        # Break if we got a successful response
-                        if status_code < 400:
-                            break
-                            
-                    except Exception as e:
-                        result['errors'].append(f"{url}: {str(e)[:100]}")
-                        continue
+                except Exception as e:
+                    result['errors'].append(f"{url}: {str(e)[:100]}")
+                    continue
         
         except Exception as e:
             result['errors'].append(f"HTTP client error: {e}")
@@ -1945,11 +2933,11 @@ class TakeoverDetector:
         # Extract error patterns and claimed indicators
         error_patterns = config.get('error_patterns', [])
         claimed_indicators = config.get('claimed_indicators', [])
-        expected_status_codes = config.get('status_codes', [404])
+        expected_status_codes = config.get('status_codes', frozenset((404,)))
         
         # Get best status code
         status_code = finding.https_status or finding.http_status
-        response_body = http_info.get('body', '').lower()
+        response_body = http_info.get('body', '')
         
         # ---- Signal 1: NXDOMAIN (strongest CNAME signal, +40) ----
         if nxdomain:
@@ -1962,7 +2950,8 @@ class TakeoverDetector:
         if chain_dangling:
             validation['confidence'] += min(35 * len(chain_dangling), 70)
             for link in chain_dangling:
-                validation['evidence'].append(f"🔴 CHAIN: Intermediate CNAME '{link}' dangling")
+                if not (nxdomain and link == finding.cname):  # Already reported by Signal 1
+                    validation['evidence'].append(f"🔴 CHAIN: Intermediate CNAME '{link}' dangling")
         
         # ---- Signal 2: DNS Configuration ----
         if finding.cname:
@@ -1975,13 +2964,18 @@ class TakeoverDetector:
             validation['confidence'] += 20
             validation['evidence'].append(f"Expected HTTP status ({status_code}) found")
         elif status_code is not None:
-            validation['evidence'].append(f"HTTP status {status_code} not in expected codes {expected_status_codes}")
+            validation['evidence'].append(f"HTTP status {status_code} not in expected codes {sorted(expected_status_codes)}")
+        
+        # Single pass over the body for every provider pattern (already done by analyze_http)
+        body_hits = http_info.get('body_hits')
+        if body_hits is None:
+            body_hits = scan_body(response_body.lower())
+        matched_patterns = {pattern for _, pattern in body_hits.get(finding.provider, ())}
         
         # ---- Signal 4: Error Patterns in Response (+30) ----
         error_found = False
         for pattern in error_patterns:
-            pattern_lower = pattern.lower()
-            if pattern_lower in response_body:
+            if pattern in matched_patterns:
                 validation['confidence'] += 30
                 validation['evidence'].append(f"Provider error message found: '{pattern}'")
                 error_found = True
@@ -1993,7 +2987,7 @@ class TakeoverDetector:
         # ---- Signal 5: No Claimed Indicators (+10) ----
         claimed_found = False
         for indicator in claimed_indicators:
-            if indicator.lower() in response_body:
+            if indicator in matched_patterns:
                 validation['evidence'].append(f"Site appears claimed (found: '{indicator}')")
                 claimed_found = True
                 # Reduce confidence — if a site is claimed, takeover is less likely
@@ -2016,7 +3010,7 @@ class TakeoverDetector:
         # ---- Signal 7: SSL Certificate Mismatch (+15) ----
         if ssl_mismatch:
             validation['confidence'] += 15
-            validation['evidence'].append(f"🟡 SSL cert does not match subdomain (misconfigured resource)")
+            validation['evidence'].append("🟡 SSL cert does not match subdomain (misconfigured resource)")
         
         # ---- Signal 8: Dangling A-Record (+15 if unreachable) ----
         if finding.dangling_a_record and not finding.is_live:
@@ -2079,79 +3073,208 @@ class TakeoverDetector:
 # REPORT GENERATOR
 # ============================================================================
 
-class ReportGenerator:
-    """Generate various report formats"""
-    
-    @staticmethod
-    def generate_html_report(scan_result: ScanResult, output_file: str):
-        """Generate interactive HTML report with search and filtering"""
-        html_template = """<!DOCTYPE html>
+# Same output as html.escape(s, quote=True), as a single C-level translate pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;",
+})
+
+def escape_html(text: str) -> str:
+    """Escape text for HTML element content and quoted attributes"""
+    return text.translate(HTML_ESCAPE_TABLE)
+
+def format_timestamp(ts: datetime) -> str:
+    """'YYYY-MM-DD HH:MM:SS' for report output, same as strftime('%Y-%m-%d %H:%M:%S').
+    Finding timestamps are unique to the microsecond, so this is made fast rather than memoized."""
+    return ts.isoformat(' ', 'seconds')[:19]
+
+# Longest free-text value shown per HTML report field; longer ones end in an ellipsis
+REPORT_FIELD_LIMIT = 500
+
+def _truncate(text: str, limit: int = REPORT_FIELD_LIMIT) -> str:
+    """Cut text to limit characters for display, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + '…'
+
+# Text reports are written in many small pieces; a 1 MiB buffer turns them into a few large writes
+REPORT_WRITE_BUFFER = 1 << 20
+# Fastest zlib level: repetitive report markup still shrinks to a small fraction
+REPORT_GZIP_LEVEL = 1
+
+def _open_report(path: str, mode: str = 'w', newline: Optional[str] = None):
+    """Open a report file for writing, gzip-compressed when the path ends in .gz"""
+    binary = 'b' in mode
+    encoding = None if binary else 'utf-8'
+    if path.endswith('.gz'):
+        return gzip.open(path, mode if binary else mode + 't', compresslevel=REPORT_GZIP_LEVEL,
+                         encoding=encoding, newline=newline)
+    return open(path, mode, buffering=REPORT_WRITE_BUFFER, encoding=encoding, newline=newline)
+
+# Finished CSS classes for the status and risk badges, one per enum member
+_STATUS_CLASS = MappingProxyType({status: f"status-{status.value.lower()}" for status in TakeoverStatus})
+_RISK_CLASS = MappingProxyType({risk: f"risk-{risk.name.lower()}" for risk in RiskLevel})
+
+# Statuses listed in the markdown report's vulnerable table
+_VULNERABLE_STATUSES = frozenset({TakeoverStatus.CONFIRMED, TakeoverStatus.HIGHLY_LIKELY,
+                                  TakeoverStatus.LIKELY, TakeoverStatus.POSSIBLE})
+
+# Findings at these statuses get no details row; the user rarely expands them
+_HTML_NO_DETAILS_STATUSES = frozenset({TakeoverStatus.SAFE, TakeoverStatus.UNLIKELY})
+
+def _evidence_css_class(evidence: str) -> str:
+    """Color class for one evidence line in the HTML report"""
+    if "NXDOMAIN" in evidence:
+        return "evidence-item nxdomain"
+    if "Wildcard" in evidence or "wildcard" in evidence:
+        return "evidence-item wildcard"
+    return "evidence-item"
+
+# Static stylesheet and script of the HTML report. They are passed in as format values,
+# so they keep single braces and str.format only scans the small page skeleton.
+_HTML_REPORT_CSS = """
+        * { box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #0f1117; color: #e1e4e8; }
+        .container { max-width: 1500px; margin: 0 auto; }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 12px; margin-bottom: 30px; box-shadow: 0 4px 20px rgba(102,126,234,0.3); }
+        .header h1 { margin: 0 0 5px 0; font-size: 1.8em; }
+        .header h2 { margin: 0 0 10px 0; font-weight: 400; font-size: 1.2em; opacity: 0.9; }
+        .header p { margin: 0; opacity: 0.8; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px; }
+        .stat-card { background: #161b22; padding: 20px; border-radius: 12px; box-shadow: 0 2px 10px rgba(0,0,0,0.3); text-align: center; border: 1px solid #30363d; }
+        .stat-value { font-size: 2.2em; font-weight: bold; color: #58a6ff; }
+        .stat-value.critical { color: #f85149; }
+        .stat-value.warning { color: #d29922; }
+        .stat-value.vuln { color: #f0883e; }
+        .stat-label { color: #8b949e; margin-top: 5px; font-size: 0.9em; }
+        .controls { margin-bottom: 20px; display: flex; flex-wrap: wrap; gap: 12px; align-items: center; }
+        .search-box { padding: 10px 15px; width: 350px; border: 1px solid #30363d; border-radius: 8px; background: #161b22; color: #e1e4e8; font-size: 14px; }
+        .search-box:focus { outline: none; border-color: #667eea; box-shadow: 0 0 0 3px rgba(102,126,234,0.2); }
+        .filter-buttons { display: flex; flex-wrap: wrap; gap: 8px; }
+        .filter-btn { padding: 8px 16px; border: 1px solid #30363d; border-radius: 8px; cursor: pointer; background: #161b22; color: #8b949e; font-size: 13px; transition: all 0.2s; }
+        .filter-btn:hover { border-color: #667eea; color: #e1e4e8; }
+        .filter-btn.active { background: #667eea; color: white; border-color: #667eea; }
+        table { width: 100%; background: #161b22; border-collapse: collapse; border-radius: 12px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.3); border: 1px solid #30363d; }
+        th, td { padding: 12px 15px; text-align: left; border-bottom: 1px solid #21262d; font-size: 14px; }
+        th { background: #0d1117; font-weight: 600; color: #8b949e; text-transform: uppercase; font-size: 12px; letter-spacing: 0.5px; }
+        tr.main-row:hover { background: #1c2128; }
+        .status-confirmed { background: rgba(248,81,73,0.15); color: #f85149; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .status-highly_likely { background: rgba(210,153,34,0.15); color: #d29922; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .status-likely { background: rgba(56,154,214,0.15); color: #389ad6; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .status-possible { background: rgba(63,185,80,0.15); color: #3fb950; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .status-unlikely { background: rgba(139,148,158,0.1); color: #8b949e; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .status-safe { background: rgba(139,148,158,0.1); color: #8b949e; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .status-error { background: rgba(248,81,73,0.1); color: #f85149; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }
+        .risk-critical { color: #f85149; font-weight: bold; }
+        .risk-high { color: #f0883e; font-weight: bold; }
+        .risk-medium { color: #d29922; font-weight: bold; }
+        .risk-low { color: #3fb950; font-weight: bold; }
+        .risk-info { color: #8b949e; }
+        .toggle-details { background: none; border: 1px solid #30363d; color: #58a6ff; cursor: pointer; padding: 5px 12px; border-radius: 6px; font-size: 12px; transition: all 0.2s; }
+        .toggle-details:hover { background: rgba(88,166,255,0.1); border-color: #58a6ff; }
+        .details-row { background: #0d1117; }
+        .details-content { padding: 20px; border-radius: 8px; margin: 5px 0; }
+        .details-content h4 { color: #58a6ff; margin: 0 0 15px 0; font-size: 1.1em; }
+        .details-content p { margin: 6px 0; color: #c9d1d9; line-height: 1.5; }
+        .details-content strong { color: #e1e4e8; }
+        .details-content ul, .details-content ol { margin: 5px 0 10px 20px; padding: 0; }
+        .details-content li { margin: 4px 0; color: #c9d1d9; line-height: 1.4; }
+        .details-content a { color: #58a6ff; text-decoration: none; }
+        .details-content a:hover { text-decoration: underline; }
+        .evidence-item { padding: 4px 8px; margin: 2px 0; background: rgba(88,166,255,0.05); border-left: 3px solid #30363d; border-radius: 0 4px 4px 0; }
+        .evidence-item.nxdomain { border-left-color: #f85149; background: rgba(248,81,73,0.08); }
+        .evidence-item.wildcard { border-left-color: #d29922; background: rgba(210,153,34,0.08); }
+        .conf-bar { display: inline-block; width: 60px; height: 8px; background: #21262d; border-radius: 4px; overflow: hidden; vertical-align: middle; margin-left: 5px; }
+        .conf-fill { height: 100%; border-radius: 4px; }
+        .footer { margin-top: 30px; text-align: center; color: #484f58; font-size: 0.85em; padding: 20px; border-top: 1px solid #21262d; }
+        @media print {
+            body { background: white; color: #24292e; }
+            .controls, .filter-buttons { display: none; }
+            .details-row { display: table-row !important; }
+        }
+    """
+
+_HTML_REPORT_JS = """
+(function() {
+    // Details ship inert in a <template>; move the row into the table when first needed
+    function materializeDetails(tpl) {
+        var detailsRow = tpl.content.querySelector('tr.details-row');
+        tpl.replaceWith(tpl.content);
+        return detailsRow;
+    }
+    // Print stylesheet shows every details row
+    window.addEventListener('beforeprint', function() {
+        document.querySelectorAll('template.details-template').forEach(materializeDetails);
+    });
+    // Toggle details - vanilla JS, no jQuery
+    document.addEventListener('click', function(e) {
+        if (e.target.classList.contains('toggle-details')) {
+            var btn = e.target;
+            var mainRow = btn.closest('tr.main-row');
+            if (!mainRow) return;
+            var detailsRow = mainRow.nextElementSibling;
+            if (detailsRow && detailsRow.tagName === 'TEMPLATE') detailsRow = materializeDetails(detailsRow);
+            if (!detailsRow || !detailsRow.classList.contains('details-row')) return;
+            var isHidden = detailsRow.style.display === 'none' || detailsRow.style.display === '';
+            detailsRow.style.display = isHidden ? 'table-row' : 'none';
+            btn.textContent = isHidden ? '\u25bc Hide' : '\u25b6 Details';
+        }
+    });
+    // Search - rows carry a prebuilt lowercase data-search text, scans are debounced
+    var searchBox = document.getElementById('search');
+    var searchTimer = null;
+    searchBox.addEventListener('input', function() {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(runSearch, 100);
+    });
+    function runSearch() {
+        var query = searchBox.value.toLowerCase();
+        document.querySelectorAll('tr.main-row').forEach(function(row) {
+            var text = row.getAttribute('data-search') || '';
+            var details = row.nextElementSibling;
+            var match = query === '' || text.indexOf(query) > -1;
+            row.style.display = match ? '' : 'none';
+            if (details && details.classList.contains('details-row')) {
+                details.style.display = 'none';
+                var btn = row.querySelector('.toggle-details');
+                if (btn) btn.textContent = '\u25b6 Details';
+            }
+        });
+    }
+    // Filter
+    var filterBtns = document.querySelectorAll('.filter-btn');
+    filterBtns.forEach(function(btn) {
+        btn.addEventListener('click', function() {
+            filterBtns.forEach(function(b) { b.classList.remove('active'); });
+            btn.classList.add('active');
+            var filter = btn.getAttribute('data-filter');
+            document.querySelectorAll('tr.main-row').forEach(function(row) {
+                var status = row.getAttribute('data-status');
+                var show = false;
+                if (filter === 'all') show = true;
+                else if (filter === 'confirmed' && status === 'CONFIRMED') show = true;
+                else if (filter === 'highly_likely' && status === 'HIGHLY_LIKELY') show = true;
+                else if (filter === 'vulnerable' && ['CONFIRMED','HIGHLY_LIKELY','LIKELY','POSSIBLE'].indexOf(status) > -1) show = true;
+                else if (filter === 'safe' && (status === 'SAFE' || status === 'UNLIKELY')) show = true;
+                row.style.display = show ? '' : 'none';
+                var details = row.nextElementSibling;
+                if (details && details.classList.contains('details-row')) {
+                    details.style.display = 'none';
+                    var tbtn = row.querySelector('.toggle-details');
+                    if (tbtn) tbtn.textContent = '\u25b6 Details';
+                }
+            });
+        });
+    });
+})();
+"""
+
+# Report page around the findings table, split once at import at the {table_rows} slot.
+# Both halves are str.format templates.
+_HTML_REPORT_HEAD, _HTML_REPORT_TAIL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>SubDomain Sentinel Report - {domain}</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #0f1117; color: #e1e4e8; }}
-        .container {{ max-width: 1500px; margin: 0 auto; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 12px; margin-bottom: 30px; box-shadow: 0 4px 20px rgba(102,126,234,0.3); }}
-        .header h1 {{ margin: 0 0 5px 0; font-size: 1.8em; }}
-        .header h2 {{ margin: 0 0 10px 0; font-weight: 400; font-size: 1.2em; opacity: 0.9; }}
-        .header p {{ margin: 0; opacity: 0.8; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px; }}
-        .stat-card {{ background: #161b22; padding: 20px; border-radius: 12px; box-shadow: 0 2px 10px rgba(0,0,0,0.3); text-align: center; border: 1px solid #30363d; }}
-        .stat-value {{ font-size: 2.2em; font-weight: bold; color: #58a6ff; }}
-        .stat-value.critical {{ color: #f85149; }}
-        .stat-value.warning {{ color: #d29922; }}
-        .stat-value.vuln {{ color: #f0883e; }}
-        .stat-label {{ color: #8b949e; margin-top: 5px; font-size: 0.9em; }}
-        .controls {{ margin-bottom: 20px; display: flex; flex-wrap: wrap; gap: 12px; align-items: center; }}
-        .search-box {{ padding: 10px 15px; width: 350px; border: 1px solid #30363d; border-radius: 8px; background: #161b22; color: #e1e4e8; font-size: 14px; }}
-        .search-box:focus {{ outline: none; border-color: #667eea; box-shadow: 0 0 0 3px rgba(102,126,234,0.2); }}
-        .filter-buttons {{ display: flex; flex-wrap: wrap; gap: 8px; }}
-        .filter-btn {{ padding: 8px 16px; border: 1px solid #30363d; border-radius: 8px; cursor: pointer; background: #161b22; color: #8b949e; font-size: 13px; transition: all 0.2s; }}
-        .filter-btn:hover {{ border-color: #667eea; color: #e1e4e8; }}
-        .filter-btn.active {{ background: #667eea; color: white; border-color: #667eea; }}
-        table {{ width: 100%; background: #161b22; border-collapse: collapse; border-radius: 12px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.3); border: 1px solid #30363d; }}
-        th, td {{ padding: 12px 15px; text-align: left; border-bottom: 1px solid #21262d; font-size: 14px; }}
-        th {{ background: #0d1117; font-weight: 600; color: #8b949e; text-transform: uppercase; font-size: 12px; letter-spacing: 0.5px; }}
-        tr.main-row:hover {{ background: #1c2128; }}
-        .status-confirmed {{ background: rgba(248,81,73,0.15); color: #f85149; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .status-highly_likely {{ background: rgba(210,153,34,0.15); color: #d29922; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .status-likely {{ background: rgba(56,154,214,0.15); color: #389ad6; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .status-possible {{ background: rgba(63,185,80,0.15); color: #3fb950; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .status-unlikely {{ background: rgba(139,148,158,0.1); color: #8b949e; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .status-safe {{ background: rgba(139,148,158,0.1); color: #8b949e; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .status-error {{ background: rgba(248,81,73,0.1); color: #f85149; padding: 4px 10px; border-radius: 4px; font-weight: 600; font-size: 12px; }}
-        .risk-critical {{ color: #f85149; font-weight: bold; }}
-        .risk-high {{ color: #f0883e; font-weight: bold; }}
-        .risk-medium {{ color: #d29922; font-weight: bold; }}
-        .risk-low {{ color: #3fb950; font-weight: bold; }}
-        .risk-info {{ color: #8b949e; }}
-        .toggle-details {{ background: none; border: 1px solid #30363d; color: #58a6ff; cursor: pointer; padding: 5px 12px; border-radius: 6px; font-size: 12px; transition: all 0.2s; }}
-        .toggle-details:hover {{ background: rgba(88,166,255,0.1); border-color: #58a6ff; }}
-        .details-row {{ background: #0d1117; }}
-        .details-content {{ padding: 20px; border-radius: 8px; margin: 5px 0; }}
-        .details-content h4 {{ color: #58a6ff; margin: 0 0 15px 0; font-size: 1.1em; }}
-        .details-content p {{ margin: 6px 0; color: #c9d1d9; line-height: 1.5; }}
-        .details-content strong {{ color: #e1e4e8; }}
-        .details-content ul, .details-content ol {{ margin: 5px 0 10px 20px; padding: 0; }}
-        .details-content li {{ margin: 4px 0; color: #c9d1d9; line-height: 1.4; }}
-        .details-content a {{ color: #58a6ff; text-decoration: none; }}
-        .details-content a:hover {{ text-decoration: underline; }}
-        .evidence-item {{ padding: 4px 8px; margin: 2px 0; background: rgba(88,166,255,0.05); border-left: 3px solid #30363d; border-radius: 0 4px 4px 0; }}
-        .evidence-item.nxdomain {{ border-left-color: #f85149; background: rgba(248,81,73,0.08); }}
-        .evidence-item.wildcard {{ border-left-color: #d29922; background: rgba(210,153,34,0.08); }}
-        .conf-bar {{ display: inline-block; width: 60px; height: 8px; background: #21262d; border-radius: 4px; overflow: hidden; vertical-align: middle; margin-left: 5px; }}
-        .conf-fill {{ height: 100%; border-radius: 4px; }}
-        .footer {{ margin-top: 30px; text-align: center; color: #484f58; font-size: 0.85em; padding: 20px; border-top: 1px solid #21262d; }}
-        @media print {{
-            body {{ background: white; color: #24292e; }}
-            .controls, .filter-buttons {{ display: none; }}
-            .details-row {{ display: table-row !important; }}
-        }}
-    </style>
+    <style>{report_css}</style>
 </head>
 <body>
     <div class="container">
@@ -2215,100 +3338,65 @@ class ReportGenerator:
         </div>
     </div>
     
-<script>
-(function() {{
-    // Toggle details - vanilla JS, no jQuery
-    document.addEventListener('click', function(e) {{
-        if (e.target.classList.contains('toggle-details')) {{
-            var btn = e.target;
-            var mainRow = btn.closest('tr.main-row');
-            if (!mainRow) return;
-            var detailsRow = mainRow.nextElementSibling;
-            if (!detailsRow || !detailsRow.classList.contains('details-row')) return;
-            var isHidden = detailsRow.style.display === 'none' || detailsRow.style.display === '';
-            detailsRow.style.display = isHidden ? 'table-row' : 'none';
-            btn.textContent = isHidden ? '\u25bc Hide' : '\u25b6 Details';
-        }}
-    }});
-    // Search
-    document.getElementById('search').addEventListener('input', function() {{
-        var query = this.value.toLowerCase();
-        document.querySelectorAll('tr.main-row').forEach(function(row) {{
-            var text = row.textContent.toLowerCase();
-            var details = row.nextElementSibling;
-            var match = query === '' || text.indexOf(query) > -1;
-            row.style.display = match ? '' : 'none';
-            if (details && details.classList.contains('details-row')) {{
-                details.style.display = 'none';
-                var btn = row.querySelector('.toggle-details');
-                if (btn) btn.textContent = '\u25b6 Details';
-            }}
-        }});
-    }});
-    // Filter
-    var filterBtns = document.querySelectorAll('.filter-btn');
-    filterBtns.forEach(function(btn) {{
-        btn.addEventListener('click', function() {{
-            filterBtns.forEach(function(b) {{ b.classList.remove('active'); }});
-            btn.classList.add('active');
-            var filter = btn.getAttribute('data-filter');
-            document.querySelectorAll('tr.main-row').forEach(function(row) {{
-                var status = row.getAttribute('data-status');
-                var show = false;
-                if (filter === 'all') show = true;
-                else if (filter === 'confirmed' && status === 'CONFIRMED') show = true;
-                else if (filter === 'highly_likely' && status === 'HIGHLY_LIKELY') show = true;
-                else if (filter === 'vulnerable' && ['CONFIRMED','HIGHLY_LIKELY','LIKELY','POSSIBLE'].indexOf(status) > -1) show = true;
-                else if (filter === 'safe' && (status === 'SAFE' || status === 'UNLIKELY')) show = true;
-                row.style.display = show ? '' : 'none';
-                var details = row.nextElementSibling;
-                if (details && details.classList.contains('details-row')) {{
-                    details.style.display = 'none';
-                    var tbtn = row.querySelector('.toggle-details');
-                    if (tbtn) tbtn.textContent = '\u25b6 Details';
-                }}
-            }});
-        }});
-    }});
-    // Sort by risk level on load
-    var riskOrder = {{'CRITICAL':5, 'HIGH':4, 'MEDIUM':3, 'LOW':2, 'INFO':1}};
-    var tbody = document.querySelector('#results-table tbody');
-    var mainRows = Array.from(tbody.querySelectorAll('tr.main-row'));
-    var pairs = mainRows.map(function(row) {{
-        var details = row.nextElementSibling;
-        return {{ main: row, details: (details && details.classList.contains('details-row')) ? details : null }};
-    }});
-    pairs.sort(function(a, b) {{
-        var rA = riskOrder[a.main.getAttribute('data-risk')] || 0;
-        var rB = riskOrder[b.main.getAttribute('data-risk')] || 0;
-        if (rB !== rA) return rB - rA;
-        var cA = parseInt(a.main.getAttribute('data-confidence') || '0');
-        var cB = parseInt(b.main.getAttribute('data-confidence') || '0');
-        return cB - cA;
-    }});
-    while (tbody.firstChild) tbody.removeChild(tbody.firstChild);
-    pairs.forEach(function(pair) {{
-        tbody.appendChild(pair.main);
-        if (pair.details) tbody.appendChild(pair.details);
-    }});
-}})();
-</script>
+<script>{report_js}</script>
 </body>
-</html>"""
-        
-        # Calculate statistics
-        confirmed = sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.CONFIRMED)
-        highly_likely = sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.HIGHLY_LIKELY)
-        likely = sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.LIKELY)
-        possible = sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.POSSIBLE)
+</html>""".split('{table_rows}')
+
+class ReportGenerator:
+    """Generate various report formats"""
+    
+    @staticmethod
+    def generate_html_report(scan_result: ScanResult, output_file: str):
+        """Generate interactive HTML report with search and filtering"""
+        # Calculate statistics in one pass
+        status_counts = Counter(f.takeover_status for f in scan_result.findings)
+        confirmed = status_counts[TakeoverStatus.CONFIRMED]
+        highly_likely = status_counts[TakeoverStatus.HIGHLY_LIKELY]
+        likely = status_counts[TakeoverStatus.LIKELY]
+        possible = status_counts[TakeoverStatus.POSSIBLE]
         vulnerable = confirmed + highly_likely + likely + possible
-        safe = sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.SAFE)
+        safe = status_counts[TakeoverStatus.SAFE]
+        
+        # Format duration for display
+        duration_display = f"{scan_result.duration:.2f}" if scan_result.duration is not None else "0.00"
+        
+        template_values = dict(
+            domain=scan_result.domain,
+            timestamp=format_timestamp(scan_result.timestamp),
+            duration_display=duration_display,
+            total_subdomains=scan_result.total_subdomains,
+            confirmed=confirmed,
+            highly_likely=highly_likely,
+            vulnerable=vulnerable,
+            safe=safe,
+            VERSION=VERSION,
+            report_css=_HTML_REPORT_CSS,
+            report_js=_HTML_REPORT_JS
+        )
         
-        # Generate table rows
-        table_rows = []
-        for finding in scan_result.findings:
-            status_class = f"status-{finding.takeover_status.value.lower()}"
-            risk_class = f"risk-{finding.risk_level.name.lower()}"
+        # Stream the report: page head, one row pair per finding, then the page tail,
+        # so memory stays flat however many subdomains were scanned
+        # Rows are emitted most severe first, so the page needs no client-side re-sort
+        # (RiskLevel is declared CRITICAL first; ties go to the higher confidence)
+        ordered = sorted(scan_result.findings, key=lambda finding: (finding.risk_level.value, -finding.confidence))
+        
+        with _open_report(output_file) as f:
+            f.write(_HTML_REPORT_HEAD.format(**template_values))
+            ReportGenerator._write_html_rows(f, ordered)
+            f.write(_HTML_REPORT_TAIL.format(**template_values))
+        
+        ColorPrinter.print(f"HTML report generated: {output_file}", "success")
+    
+    @staticmethod
+    def _write_html_rows(f, findings: List[SubdomainFinding]):
+        """Write the main row and collapsible details row for each finding"""
+        esc = escape_html
+        write = f.write
+        for finding in findings:
+            # Enum names/values and numbers are written as-is; only free text is escaped
+            subdomain_html = esc(finding.subdomain)
+            status_class = _STATUS_CLASS[finding.takeover_status]
+            risk_class = _RISK_CLASS[finding.risk_level]
             
             # Format CNAME for display
             cname_display = finding.cname[:30] + "..." if finding.cname and len(finding.cname) > 30 else finding.cname
@@ -2317,93 +3405,73 @@ class ReportGenerator:
             conf = finding.confidence
             conf_color = '#f85149' if conf >= 80 else '#d29922' if conf >= 40 else '#3fb950' if conf >= 20 else '#8b949e'
             
+            # Lowercase text the search box matches against, built once here instead of per keystroke
+            search_text = esc(f"{finding.subdomain} {finding.provider or ''} {finding.cname or ''} "
+                              f"{finding.takeover_status.value} {finding.risk_level.name}".lower())
+            
+            with_details = finding.takeover_status not in _HTML_NO_DETAILS_STATUSES
+            toggle_cell = '<td><button class="toggle-details">▶ Details</button></td>' if with_details else '<td></td>'
+            
             # Create main row
             row = f"""
-<tr class="main-row" data-status="{finding.takeover_status.value}" data-risk="{finding.risk_level.name}" data-confidence="{finding.confidence}">
-    <td><strong>{html.escape(finding.subdomain)}</strong></td>
-    <td>{html.escape(finding.provider or 'N/A')}</td>
-    <td title="{html.escape(finding.cname or '')}">{html.escape(cname_display or 'N/A')}</td>
+<tr class="main-row" data-status="{finding.takeover_status.value}" data-risk="{finding.risk_level.name}" data-confidence="{finding.confidence}" data-search="{search_text}">
+    <td><strong>{subdomain_html}</strong></td>
+    <td>{esc(finding.provider) if finding.provider else 'N/A'}</td>
+    <td title="{esc(finding.cname) if finding.cname else ''}">{esc(cname_display) if cname_display else 'N/A'}</td>
     <td><span class="{status_class}">{finding.takeover_status.value}</span></td>
     <td>{finding.http_status or 'N/A'}/{finding.https_status or 'N/A'}</td>
     <td><span class="{risk_class}">{finding.risk_level.name}</span></td>
     <td>{finding.confidence}% <span class="conf-bar"><span class="conf-fill" style="width:{min(conf,100)}%;background:{conf_color}"></span></span></td>
-    <td><button class="toggle-details">▶ Details</button></td>
+    {toggle_cell}
 </tr>"""
+            write(row)
+            if not with_details:
+                continue
             
             # Build evidence HTML with color-coded items
-            evidence_html = ""
-            for e in (finding.evidence[:10] if finding.evidence else []):
-                css_class = "evidence-item"
-                if "NXDOMAIN" in e:
-                    css_class += " nxdomain"
-                elif "Wildcard" in e or "wildcard" in e:
-                    css_class += " wildcard"
-                evidence_html += f'<div class="{css_class}">{html.escape(e)}</div>'
-            if not evidence_html:
-                evidence_html = '<div class="evidence-item">No evidence collected</div>'
+            evidence_html = ''.join(
+                f'<div class="{_evidence_css_class(e)}">{esc(_truncate(e))}</div>' for e in finding.evidence[:10]
+            ) or '<div class="evidence-item">No evidence collected</div>'
             
-            # Create details row
+            # Create details row, kept inert until first opened
             details = f"""
-<tr class="details-row" style="display: none;">
+<template class="details-template"><tr class="details-row" style="display: none;">
 <td colspan="8">
     <div class="details-content">
-        <h4>🔍 Detailed Analysis — {html.escape(finding.subdomain)}</h4>
-        <p><strong>CNAME Chain:</strong> {html.escape(' → '.join(finding.cname_chain) if finding.cname_chain else 'None')}</p>
-        <p><strong>A Records:</strong> {html.escape(', '.join(finding.a_records) if finding.a_records else 'None')}</p>
-        <p><strong>NS Records:</strong> {html.escape(', '.join(finding.ns_records) if finding.ns_records else 'None')}</p>
+        <h4>🔍 Detailed Analysis — {subdomain_html}</h4>
+        <p><strong>CNAME Chain:</strong> {esc(_truncate(' → '.join(finding.cname_chain))) if finding.cname_chain else 'None'}</p>
+        <p><strong>A Records:</strong> {esc(_truncate(', '.join(finding.a_records))) if finding.a_records else 'None'}</p>
+        <p><strong>NS Records:</strong> {esc(_truncate(', '.join(finding.ns_records))) if finding.ns_records else 'None'}</p>
         <p><strong>HTTP Status:</strong> {finding.http_status or 'N/A'} | <strong>HTTPS Status:</strong> {finding.https_status or 'N/A'}</p>
-        <p><strong>SSL Cert CN:</strong> {html.escape(finding.ssl_cert_cn or 'N/A')}</p>
-        <p><strong>Header Fingerprint:</strong> {html.escape(finding.header_fingerprint or 'None')}</p>
-        <p><strong>Page Title:</strong> {html.escape(finding.page_title or 'N/A')}</p>
+        <p><strong>SSL Cert CN:</strong> {esc(_truncate(finding.ssl_cert_cn)) if finding.ssl_cert_cn else 'N/A'}</p>
+        <p><strong>Header Fingerprint:</strong> {esc(_truncate(finding.header_fingerprint)) if finding.header_fingerprint else 'None'}</p>
+        <p><strong>Page Title:</strong> {esc(_truncate(finding.page_title)) if finding.page_title else 'N/A'}</p>
         <p><strong>Response Time:</strong> {f"{finding.response_time:.2f}s" if finding.response_time is not None else 'N/A'}</p>
-        <p><strong>Final URL:</strong> <a href="{html.escape(finding.final_url or '#')}" target="_blank">{html.escape(finding.final_url or 'N/A')}</a></p>
+        <p><strong>Final URL:</strong> <a href="{esc(finding.final_url or '#')}" target="_blank">{esc(_truncate(finding.final_url)) if finding.final_url else 'N/A'}</a></p>
         <p><strong>Evidence ({len(finding.evidence)} signals):</strong></p>
         {evidence_html}
-        {('<p><strong>Verification Steps:</strong></p><ol>' + 
-          ''.join([f'<li>{html.escape(step)}</li>' for step in finding.verification_steps[:5]]) + 
+        {('<p><strong>Verification Steps:</strong></p><ol>' +
+          ''.join(f'<li>{esc(_truncate(step))}</li>' for step in finding.verification_steps[:5]) +
           '</ol>') if finding.verification_steps else ''}
-        <p><strong>Timestamp:</strong> {finding.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p><strong>Timestamp:</strong> {format_timestamp(finding.timestamp)}</p>
     </div>
 </td>
-</tr>"""
+</tr></template>"""
             
-            table_rows.append(row + details)
-        
-        # Format duration for display
-        duration_display = f"{scan_result.duration:.2f}" if scan_result.duration is not None else "0.00"
-        
-        # Format the template
-        html_content = html_template.format(
-            domain=scan_result.domain,
-            timestamp=scan_result.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            duration_display=duration_display,
-            total_subdomains=scan_result.total_subdomains,
-            confirmed=confirmed,
-            highly_likely=highly_likely,
-            vulnerable=vulnerable,
-            safe=safe,
-            table_rows=''.join(table_rows),
-            VERSION=VERSION
-        )
-        
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        ColorPrinter.print(f"HTML report generated: {output_file}", "success")
-        
+            write(details)
+    
     @staticmethod
     def generate_json_report(scan_result: ScanResult, output_file: str):
         """Generate JSON report"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(scan_result.to_dict(), f, indent=2, default=str)
+        with _open_report(output_file, 'wb') as f:
+            f.writelines(scan_result.iter_json_chunks())
         
         ColorPrinter.print(f"JSON report generated: {output_file}", "success")
     
     @staticmethod
     def generate_csv_report(scan_result: ScanResult, output_file: str):
         """Generate CSV report"""
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with _open_report(output_file, newline='') as f:
             writer = csv.writer(f)
             writer.writerow([
                 'Subdomain', 'Provider', 'CNAME', 'CNAME Chain', 'A Records',
@@ -2412,65 +3480,75 @@ class ReportGenerator:
                 'Is Live', 'Timestamp'
             ])
             
-            for finding in scan_result.findings:
-                writer.writerow([
-                    finding.subdomain,
-                    finding.provider or '',
-                    finding.cname or '',
-                    ' -> '.join(finding.cname_chain),
-                    ', '.join(finding.a_records),
-                    finding.http_status or '',
-                    finding.https_status or '',
-                    finding.page_title or '',
-                    finding.response_time or '',
-                    finding.takeover_status.value,
-                    finding.confidence,
-                    finding.risk_level.name,
-                    ' | '.join(finding.evidence[:3]),
-                    finding.is_live,
-                    finding.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                ])
+            # One call into the C writer for all findings
+            writer.writerows(map(ReportGenerator._csv_row, scan_result.findings))
         
         ColorPrinter.print(f"CSV report generated: {output_file}", "success")
     
+    @staticmethod
+    def _csv_row(finding: SubdomainFinding) -> Tuple[Any, ...]:
+        """CSV columns for one finding, in header order"""
+        return (
+            finding.subdomain,
+            finding.provider or '',
+            finding.cname or '',
+            ' -> '.join(finding.cname_chain),
+            ', '.join(finding.a_records),
+            finding.http_status or '',
+            finding.https_status or '',
+            finding.page_title or '',
+            finding.response_time or '',
+            finding.takeover_status.value,
+            finding.confidence,
+            finding.risk_level.name,
+            ' | '.join(finding.evidence[:3]),
+            finding.is_live,
+            format_timestamp(finding.timestamp)
+        )
+    
     @staticmethod
     def generate_markdown_report(scan_result: ScanResult, output_file: str):
         """Generate Markdown report"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"# SubDomain Sentinel Report\n\n")
+        with _open_report(output_file) as f:
+            f.write("# SubDomain Sentinel Report\n\n")
             f.write(f"**Domain:** {scan_result.domain}\n")
-            f.write(f"**Scan Time:** {scan_result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"**Scan Time:** {format_timestamp(scan_result.timestamp)}\n")
             f.write(f"**Duration:** {scan_result.duration:.2f} seconds\n")
             f.write(f"**Total Subdomains:** {scan_result.total_subdomains}\n\n")
             
             f.write("## Summary\n\n")
-            f.write(f"- ✅ **Safe:** {sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.SAFE)}\n")
-            f.write(f"- ⚠️ **Possible:** {sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.POSSIBLE)}\n")
-            f.write(f"- 🔥 **Likely:** {sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.LIKELY)}\n")
-            f.write(f"- 🚨 **Highly Likely:** {sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.HIGHLY_LIKELY)}\n")
-            f.write(f"- 💀 **Confirmed:** {sum(1 for f in scan_result.findings if f.takeover_status == TakeoverStatus.CONFIRMED)}\n\n")
+            status_counts = Counter(finding.takeover_status for finding in scan_result.findings)
+            f.write(f"- ✅ **Safe:** {status_counts[TakeoverStatus.SAFE]}\n")
+            f.write(f"- ⚠️ **Possible:** {status_counts[TakeoverStatus.POSSIBLE]}\n")
+            f.write(f"- 🔥 **Likely:** {status_counts[TakeoverStatus.LIKELY]}\n")
+            f.write(f"- 🚨 **Highly Likely:** {status_counts[TakeoverStatus.HIGHLY_LIKELY]}\n")
+            f.write(f"- 💀 **Confirmed:** {status_counts[TakeoverStatus.CONFIRMED]}\n\n")
             
             f.write("## Vulnerable Subdomains\n\n")
             f.write("| Subdomain | Provider | CNAME | Status | Risk | Confidence |\n")
             f.write("|-----------|----------|-------|--------|------|------------|\n")
             
-            vulnerable_findings = [f for f in scan_result.findings 
-                                 if f.takeover_status in [TakeoverStatus.CONFIRMED, TakeoverStatus.HIGHLY_LIKELY, 
-                                                         TakeoverStatus.LIKELY, TakeoverStatus.POSSIBLE]]
+            vulnerable_findings = [finding for finding in scan_result.findings
+                                   if finding.takeover_status in _VULNERABLE_STATUSES]
             
-            for finding in sorted(vulnerable_findings, 
-                                key=lambda x: (x.confidence, x.risk_level.value), 
-                                reverse=True):
-                f.write(f"| {finding.subdomain} | {finding.provider or 'N/A'} | {finding.cname[:30] if finding.cname else 'N/A'} | "
-                       f"{finding.takeover_status.value} | {finding.risk_level.name} | {finding.confidence}% |\n")
+            # One writelines() per table instead of a write() call per row
+            f.writelines(
+                f"| {finding.subdomain} | {finding.provider or 'N/A'} | {finding.cname[:30] if finding.cname else 'N/A'} | "
+                f"{finding.takeover_status.value} | {finding.risk_level.name} | {finding.confidence}% |\n"
+                for finding in sorted(vulnerable_findings,
+                                      key=attrgetter('confidence', 'risk_level.value'),
+                                      reverse=True)
+            )
             
             f.write("\n## All Subdomains\n\n")
             f.write("| Subdomain | Provider | Status | Risk |\n")
             f.write("|-----------|----------|--------|------|\n")
             
-            for finding in scan_result.findings:
-                f.write(f"| {finding.subdomain} | {finding.provider or 'N/A'} | "
-                       f"{finding.takeover_status.value} | {finding.risk_level.name} |\n")
+            f.writelines(
+                f"| {finding.subdomain} | {finding.provider or 'N/A'} | "
+                f"{finding.takeover_status.value} | {finding.risk_level.name} |\n"
+                for finding in scan_result.findings
+            )
         
         ColorPrinter.print(f"Markdown report generated: {output_file}", "success")
     
@@ -2479,6 +3557,15 @@ class ReportGenerator:
 # MAIN SCANNER
 # ============================================================================
 
+# Seconds between progress line redraws during takeover analysis
+PROGRESS_INTERVAL = 0.25
+
+# Names waiting between enumeration and takeover analysis; a full queue pauses the sources
+ANALYSIS_QUEUE_SIZE = 1000
+
+# Statuses that are listed under CRITICAL FINDINGS and make the scan exit with code 2
+_CRITICAL_STATUSES = frozenset({TakeoverStatus.CONFIRMED, TakeoverStatus.HIGHLY_LIKELY})
+
 class SubDomainSentinel:
     """Main scanner class"""
     
@@ -2494,31 +3581,49 @@ class SubDomainSentinel:
         """Main execution flow"""
         self.start_time = time.time()
         
+        # The cache file is read and written once per scan, in a worker thread
+        loop = asyncio.get_running_loop()
+        if not getattr(self.args, 'no_cache', False):
+            await loop.run_in_executor(None, open_dns_cache)
+        
         ColorPrinter.print_banner()
         ColorPrinter.print(f"Starting scan for: {self.domain}", "info")
         
         try:
-            # Step 1: Subdomain Enumeration
-            self.subdomains = await self.enumerate_subdomains()
+            # Steps 1 and 2: Subdomain Enumeration feeding Takeover Analysis. Names found by
+            # a source are analyzed while the slower sources are still running.
+            queue = asyncio.Queue(maxsize=ANALYSIS_QUEUE_SIZE)
+            
+            async def feed():
+                self.subdomains = await self.enumerate_subdomains(queue)
+                await queue.put(None)
+            
+            # If either side fails the other is cancelled, so a full queue never blocks forever
+            feeding = asyncio.ensure_future(feed())
+            analysis = asyncio.ensure_future(self.analyze_subdomains(queue))
+            try:
+                await asyncio.gather(feeding, analysis)
+            finally:
+                feeding.cancel()
+                analysis.cancel()
+            self.findings = analysis.result()
             
             if not self.subdomains:
                 ColorPrinter.print("No subdomains found!", "error")
                 return None
             
-            # Step 2: Takeover Analysis
-            self.findings = await self.analyze_subdomains()
-            
             # Step 3: Generate Reports
             self.end_time = time.time()
             duration = self.end_time - self.start_time
             
             scan_result = ScanResult(
                 domain=self.domain,
-                timestamp=datetime.now(),
+                timestamp=datetime.fromtimestamp(self.end_time),
                 duration=duration,
                 total_subdomains=len(self.subdomains),
                 findings=self.findings,
-                statistics=self.generate_statistics()
+                statistics=self.generate_statistics(),
+                critical_findings=[f for f in self.findings if f.takeover_status in _CRITICAL_STATUSES]
             )
             
             await self.generate_reports(scan_result)
@@ -2531,123 +3636,188 @@ class SubDomainSentinel:
                 import traceback
                 traceback.print_exc()
             return None
+        finally:
+            await close_http_clients()
+            await loop.run_in_executor(None, close_dns_cache)
     
-    async def enumerate_subdomains(self) -> Set[str]:
-        """Enumerate subdomains from all sources"""
-        all_subs = set()
+    async def enumerate_subdomains(self, queue: asyncio.Queue = None) -> Set[str]:
+        """Enumerate subdomains from all sources, running side by side. With a queue, every new
+        name is also put on it as soon as its source finishes."""
+        all_subs = self.subdomains = set()
+        loop = asyncio.get_running_loop()
+        
+        async def collect(subs: Iterable[str]):
+            for sub in subs:
+                if sub not in all_subs:
+                    all_subs.add(sub)
+                    if queue is not None:
+                        await queue.put(sub)
         
         # Use Subfinder if enabled
-        if self.args.subfinder:
-            subfinder_subs = await SubfinderIntegration.enumerate_with_subfinder(
+        async def from_subfinder():
+            await collect(await SubfinderIntegration.enumerate_with_subfinder(
                 domain=self.domain,
                 use_subfinder=self.args.subfinder,
                 subfinder_bin=self.args.subfinder_bin,
                 subfinder_args=self.args.subfinder_args,
                 debug=self.args.debug
-            )
-            all_subs.update(subfinder_subs)
+            ))
         
         # Use built-in enumerator
-        if not self.args.subfinder_only:
+        async def from_enumerator():
             async with SubdomainEnumerator(
                 domain=self.domain,
                 enable_bruteforce=self.args.bruteforce,
-                wordlist=self.load_wordlist()
+                # The wordlist file is only read when brute-force will probe it
+                wordlist=await loop.run_in_executor(None, self.load_wordlist) if self.args.bruteforce else None,
+                nameservers=self.args.dns_servers,
+                massdns_bin=MassdnsIntegration.find_massdns_binary(self.args.massdns_bin) if self.args.bruteforce else None,
+                resolvers_file=self.args.resolvers_file,
+                debug=self.args.debug,
+                session=get_aiohttp(self.args.dns_servers),
+                max_hits=self.args.max_hits
             ) as enumerator:
-                enum_subs = await enumerator.enumerate_all()
-                all_subs.update(enum_subs)
+                await collect(await enumerator.enumerate_all())
         
-        # Add user-provided subdomains
-        if self.args.subdomains_file:
-            try:
-                with open(self.args.subdomains_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        sub = line.strip().lower()
-                        if sub and self.domain in sub:
-                            all_subs.add(sub)
-            except Exception as e:
-                ColorPrinter.print(f"Error reading subdomains file: {e}", "warning")
+        # Add user-provided subdomains, read in a worker thread
+        async def from_file():
+            await collect(await loop.run_in_executor(None, self.read_subdomains_file))
         
-        # Add single subdomain if provided
+        # The single subdomain and the file are the quickest sources, so they go first
+        sources = []
         if self.args.single_subdomain:
-            all_subs.add(self.args.single_subdomain.lower())
+            sources.append(collect([self.args.single_subdomain.lower()]))
+        if self.args.subdomains_file:
+            sources.append(from_file())
+        if self.args.subfinder:
+            sources.append(from_subfinder())
+        if not self.args.subfinder_only:
+            sources.append(from_enumerator())
+        
+        tasks = [asyncio.ensure_future(source) for source in sources]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
         
         return all_subs
     
+    def read_subdomains_file(self) -> Set[str]:
+        """Read --subdomains-file, keeping only names under the target domain (blocking; run off the event loop)"""
+        try:
+            suffix = "." + self.domain
+            with open(self.args.subdomains_file, 'r', encoding='utf-8') as f:
+                # Streamed straight into the set; only names under the target domain are kept
+                subs = (line.strip().lower() for line in f)
+                return {sub for sub in subs if sub.endswith(suffix) or sub == self.domain}
+        except Exception as e:
+            ColorPrinter.print(f"Error reading subdomains file: {e}", "warning")
+            return set()
+    
     def load_wordlist(self) -> List[str]:
         """Load wordlist for brute-force"""
-        wordlist = COMMON_SUBDOMAINS.copy()
+        # Ordered set: built-in words first, then new words from the file, each kept once
+        words = dict.fromkeys(COMMON_SUBDOMAINS)
         
         # Load custom wordlist if provided
         if self.args.wordlist_file:
             try:
-                if os.path.exists(self.args.wordlist_file):
-                    with open(self.args.wordlist_file, 'r', encoding='utf-8') as f:
-                        custom_words = [line.strip() for line in f if line.strip()]
-                        wordlist.extend(custom_words)
-                        wordlist = list(set(wordlist))  # Remove duplicates
-                        ColorPrinter.print(f"Loaded {len(custom_words)} words from wordlist file", "info")
-                else:
-                    ColorPrinter.print(f"Wordlist file not found: {self.args.wordlist_file}", "warning")
-                    ColorPrinter.print("Using built-in wordlist instead", "info")
+                with open(self.args.wordlist_file, 'r', encoding='utf-8') as f:
+                    custom_words = dict.fromkeys(filter(None, map(str.strip, f)))
+                words.update(custom_words)
+                ColorPrinter.print(f"Loaded {len(custom_words)} words from wordlist file", "info")
+            except FileNotFoundError:
+                ColorPrinter.print(f"Wordlist file not found: {self.args.wordlist_file}", "warning")
+                ColorPrinter.print("Using built-in wordlist instead", "info")
             except Exception as e:
                 ColorPrinter.print(f"Error loading wordlist file: {e}", "warning")
         
-        return wordlist
+        return list(words)
     
-    async def analyze_subdomains(self) -> List[SubdomainFinding]:
-        """Analyze all subdomains for takeover (concurrent with semaphore)"""
-        ColorPrinter.print(f"Analyzing {len(self.subdomains)} subdomains (concurrency: {self.args.threads})...", "info")
+    async def analyze_subdomains(self, queue: asyncio.Queue = None) -> List[SubdomainFinding]:
+        """Analyze subdomains for takeover with a fixed pool of concurrent workers. Without a queue
+        self.subdomains is analyzed; with one, names are taken from it until a None arrives."""
+        if queue is None:
+            ColorPrinter.print(f"Analyzing {len(self.subdomains)} subdomains (concurrency: {self.args.threads})...", "info")
+            queue = asyncio.Queue()
+            for subdomain in self.subdomains:
+                queue.put_nowait(subdomain)
+            queue.put_nowait(None)
+        else:
+            ColorPrinter.print(f"Analyzing subdomains as they are found (concurrency: {self.args.threads})...", "info")
         
         detector = TakeoverDetector(self.domain, self.args)
-        semaphore = asyncio.Semaphore(self.args.threads)
-        completed = [0]
-        total = len(self.subdomains)
-        
-        async def bounded_analyze(subdomain: str) -> SubdomainFinding:
-            async with semaphore:
-                finding = await detector.analyze_subdomain(subdomain)
-                completed[0] += 1
-                if not self.args.quiet and completed[0] % 10 == 0:
-                    print(f"  Progress: {completed[0]}/{total} ({completed[0]*100//total}%)", end='\r')
-                return finding
-        
-        tasks = [bounded_analyze(sub) for sub in self.subdomains]
-        findings = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions and convert to list
         valid_findings = []
-        for result in findings:
-            if isinstance(result, SubdomainFinding):
-                valid_findings.append(result)
-            elif isinstance(result, Exception):
-                if self.args.debug:
-                    ColorPrinter.print(f"Analysis exception: {result}", "error")
-        
-        if not self.args.quiet:
+        last_progress = [0.0]
+        
+        # Only `threads` coroutines exist at once; each takes the next name when it is done
+        async def worker():
+            while True:
+                subdomain = await queue.get()
+                if subdomain is None:
+                    # Hand the end marker on so the other workers stop too
+                    queue.put_nowait(None)
+                    return
+                try:
+                    valid_findings.append(await detector.analyze_subdomain(subdomain))
+                except Exception as e:
+                    if self.args.debug:
+                        ColorPrinter.print(f"Analysis exception: {e}", "error")
+                    continue
+                if not self.args.quiet:
+                    now = time.monotonic()
+                    if now - last_progress[0] >= PROGRESS_INTERVAL:
+                        last_progress[0] = now
+                        # The total keeps growing while enumeration is still running
+                        completed, total = len(valid_findings), len(self.subdomains)
+                        print(f"  Progress: {completed}/{total} ({completed*100//total}%)", end='\r', flush=True)
+        
+        await asyncio.gather(*(worker() for _ in range(max(1, self.args.threads))))
+        
+        total = len(self.subdomains)
+        if total and not self.args.quiet:
             print(f"  Progress: {total}/{total} (100%)    ")
         
         return valid_findings
     
     def generate_statistics(self) -> Dict[str, Any]:
         """Generate scan statistics"""
+        # One pass over the findings feeds every tally; plain dicts count faster than
+        # Counter item updates, and are wrapped in Counters once at the end
+        live = 0
+        provider_tally = {}
+        status_tally = {}
+        risk_tally = {}
+        for f in self.findings:
+            if f.is_live:
+                live += 1
+            provider = f.provider
+            if provider:
+                provider_tally[provider] = provider_tally.get(provider, 0) + 1
+            status = f.takeover_status
+            status_tally[status] = status_tally.get(status, 0) + 1
+            risk = f.risk_level
+            risk_tally[risk] = risk_tally.get(risk, 0) + 1
+        status_counts = Counter(status_tally)
+        
         stats = {
             'total_subdomains': len(self.subdomains),
-            'live_subdomains': sum(1 for f in self.findings if f.is_live),
-            'providers_found': Counter(f.provider for f in self.findings if f.provider),
-            'status_distribution': Counter(f.takeover_status.value for f in self.findings),
-            'risk_distribution': Counter(f.risk_level.name for f in self.findings),
+            'live_subdomains': live,
+            'providers_found': Counter(provider_tally),
+            'status_distribution': Counter({status.value: count for status, count in status_tally.items()}),
+            'risk_distribution': Counter({risk.name: count for risk, count in risk_tally.items()}),
         }
         
         # Add takeover statistics
         takeover_stats = {
-            'confirmed': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.CONFIRMED),
-            'highly_likely': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.HIGHLY_LIKELY),
-            'likely': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.LIKELY),
-            'possible': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.POSSIBLE),
-            'unlikely': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.UNLIKELY),
-            'safe': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.SAFE),
-            'error': sum(1 for f in self.findings if f.takeover_status == TakeoverStatus.ERROR),
+            'confirmed': status_counts[TakeoverStatus.CONFIRMED],
+            'highly_likely': status_counts[TakeoverStatus.HIGHLY_LIKELY],
+            'likely': status_counts[TakeoverStatus.LIKELY],
+            'possible': status_counts[TakeoverStatus.POSSIBLE],
+            'unlikely': status_counts[TakeoverStatus.UNLIKELY],
+            'safe': status_counts[TakeoverStatus.SAFE],
+            'error': status_counts[TakeoverStatus.ERROR],
         }
         
         stats['takeover_stats'] = takeover_stats
@@ -2658,24 +3828,34 @@ class SubDomainSentinel:
         """Generate all requested reports"""
         if not self.args.no_reports:
             base_name = self.args.output or f"sentinel_{self.domain}_{int(time.time())}"
+            gz = ".gz" if self.args.gzip else ""
+            
+            reports = []
             
             if self.args.html:
-                ReportGenerator.generate_html_report(scan_result, f"{base_name}.html")
+                reports.append((ReportGenerator.generate_html_report, f"{base_name}.html{gz}"))
             
             if self.args.json:
-                ReportGenerator.generate_json_report(scan_result, f"{base_name}.json")
+                reports.append((ReportGenerator.generate_json_report, f"{base_name}.json{gz}"))
             
             if self.args.csv:
-                ReportGenerator.generate_csv_report(scan_result, f"{base_name}.csv")
+                reports.append((ReportGenerator.generate_csv_report, f"{base_name}.csv{gz}"))
             
             if self.args.markdown:
-                ReportGenerator.generate_markdown_report(scan_result, f"{base_name}.md")
+                reports.append((ReportGenerator.generate_markdown_report, f"{base_name}.md{gz}"))
             
             # Generate all if no specific format requested
-            if not any([self.args.html, self.args.json, self.args.csv, self.args.markdown]):
-                ReportGenerator.generate_html_report(scan_result, f"{base_name}.html")
-                ReportGenerator.generate_json_report(scan_result, f"{base_name}.json")
-                ReportGenerator.generate_csv_report(scan_result, f"{base_name}.csv")
+            if not reports:
+                reports = [
+                    (ReportGenerator.generate_html_report, f"{base_name}.html{gz}"),
+                    (ReportGenerator.generate_json_report, f"{base_name}.json{gz}"),
+                    (ReportGenerator.generate_csv_report, f"{base_name}.csv{gz}"),
+                ]
+            
+            # Each report goes to its own file; write them side by side in the default executor
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(None, generate, scan_result, path)
+                                   for generate, path in reports))
     
     def print_summary(self, scan_result: ScanResult):
         """Print summary to console"""
@@ -2684,51 +3864,55 @@ class SubDomainSentinel:
         
         stats = scan_result.statistics
         takeover_stats = stats.get('takeover_stats', {})
-        
-        ColorPrinter.print("\n" + "="*60, "info")
-        ColorPrinter.print("📊 SCAN SUMMARY", "info")
-        ColorPrinter.print("="*60, "info")
-        
-        print(f"Domain: {self.domain}")
-        print(f"Duration: {scan_result.duration:.2f} seconds")
-        print(f"Total Subdomains: {len(self.subdomains)}")
-        print(f"Live Subdomains: {stats.get('live_subdomains', 0)}")
-        
-        ColorPrinter.print("\n🔍 TAKEOVER FINDINGS:", "info")
-        print(f"  💀 Confirmed: {takeover_stats.get('confirmed', 0)}")
-        print(f"  🚨 Highly Likely: {takeover_stats.get('highly_likely', 0)}")
-        print(f"  🔥 Likely: {takeover_stats.get('likely', 0)}")
-        print(f"  ⚠️ Possible: {takeover_stats.get('possible', 0)}")
-        print(f"  ❓ Unlikely: {takeover_stats.get('unlikely', 0)}")
-        print(f"  ✅ Safe: {takeover_stats.get('safe', 0)}")
-        print(f"  ❌ Errors: {takeover_stats.get('error', 0)}")
+        fmt = ColorPrinter.format
+        
+        # Collected into one list and written with a single call
+        lines = [
+            fmt("\n" + "="*60, "info"),
+            fmt("📊 SCAN SUMMARY", "info"),
+            fmt("="*60, "info"),
+            f"Domain: {self.domain}",
+            f"Duration: {scan_result.duration:.2f} seconds",
+            f"Total Subdomains: {len(self.subdomains)}",
+            f"Live Subdomains: {stats.get('live_subdomains', 0)}",
+            fmt("\n🔍 TAKEOVER FINDINGS:", "info"),
+            f"  💀 Confirmed: {takeover_stats.get('confirmed', 0)}",
+            f"  🚨 Highly Likely: {takeover_stats.get('highly_likely', 0)}",
+            f"  🔥 Likely: {takeover_stats.get('likely', 0)}",
+            f"  ⚠️ Possible: {takeover_stats.get('possible', 0)}",
+            f"  ❓ Unlikely: {takeover_stats.get('unlikely', 0)}",
+            f"  ✅ Safe: {takeover_stats.get('safe', 0)}",
+            f"  ❌ Errors: {takeover_stats.get('error', 0)}",
+        ]
         
         # Print confirmed and highly likely findings
-        critical_findings = [f for f in scan_result.findings 
-                           if f.takeover_status in [TakeoverStatus.CONFIRMED, TakeoverStatus.HIGHLY_LIKELY]]
+        critical_findings = scan_result.critical_findings
         
         if critical_findings:
-            ColorPrinter.print("\n🚨 CRITICAL FINDINGS:", "critical")
+            lines.append(fmt("\n🚨 CRITICAL FINDINGS:", "critical"))
             for finding in critical_findings:
-                print(f"  • {finding.subdomain}")
-                print(f"    Provider: {finding.provider}")
-                print(f"    CNAME: {finding.cname}")
-                print(f"    Status: {finding.takeover_status.value}")
-                print(f"    Confidence: {finding.confidence}%")
+                lines.append(f"  • {finding.subdomain}")
+                lines.append(f"    Provider: {finding.provider}")
+                lines.append(f"    CNAME: {finding.cname}")
+                lines.append(f"    Status: {finding.takeover_status.value}")
+                lines.append(f"    Confidence: {finding.confidence}%")
                 if finding.verification_steps:
-                    print(f"    Next Steps: {finding.verification_steps[0]}")
-                print()
+                    lines.append(f"    Next Steps: {finding.verification_steps[0]}")
+                lines.append("")
         
         # Print provider distribution
         providers = stats.get('providers_found', Counter())
         if providers:
-            ColorPrinter.print("\n🏢 PROVIDER DISTRIBUTION:", "info")
+            lines.append(fmt("\n🏢 PROVIDER DISTRIBUTION:", "info"))
             for provider, count in providers.most_common():
-                print(f"  {provider}: {count}")
+                lines.append(f"  {provider}: {count}")
+        
+        lines.append(fmt("\n" + "="*60, "info"))
+        lines.append(fmt("Scan completed!", "success"))
+        lines.append(fmt("="*60, "info"))
         
-        ColorPrinter.print("\n" + "="*60, "info")
-        ColorPrinter.print("Scan completed!", "success")
-        ColorPrinter.print("="*60, "info")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 # ============================================================================
 # COMMAND LINE INTERFACE
@@ -2738,7 +3922,7 @@ def parse_args():
     parser = argparse.ArgumentParser(
         description=f"SubDomain Sentinel v{VERSION} - Enterprise Subdomain Takeover Scanner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+        epilog="""
 Examples:
   %(prog)s example.com
   %(prog)s example.com --subfinder --html
@@ -2747,6 +3931,9 @@ Examples:
   %(prog)s example.com --subdomains-file subs.txt --output report
   %(prog)s example.com --single-subdomain test.example.com --debug
   %(prog)s example.com --no-reports --quiet
+
+The uvloop event loop is used automatically when installed (Linux/macOS);
+Windows always runs on the default asyncio event loop.
         """
     )
     
@@ -2762,6 +3949,10 @@ Examples:
     parser.add_argument("--subfinder-args", default="", help="Additional arguments for Subfinder")
     parser.add_argument("--bruteforce", action="store_true", help="Enable DNS brute-force enumeration")
     parser.add_argument("--wordlist-file", help="Custom wordlist file for brute-force")
+    parser.add_argument("--massdns-bin", default="massdns", help="Path to massdns binary used for brute-force when found (default: massdns)")
+    parser.add_argument("--max-hits", type=int, default=0, metavar="N",
+                        help="Stop the built-in brute-force after N hits (default: 0 = no limit)")
+    parser.add_argument("--resolvers-file", help="Resolver list for massdns (default: Cloudflare, Google, Quad9)")
     
     # Output options
     parser.add_argument("-o", "--output", help="Base name for output files")
@@ -2770,11 +3961,22 @@ Examples:
     parser.add_argument("--csv", action="store_true", help="Generate CSV report")
     parser.add_argument("--markdown", action="store_true", help="Generate Markdown report")
     parser.add_argument("--no-reports", action="store_true", help="Don't generate any report files")
+    parser.add_argument("--gzip", action="store_true", help="Write report files gzip-compressed (adds a .gz suffix)")
     
     # Performance options
     parser.add_argument("-t", "--threads", type=int, default=50, help="Concurrent threads (default: 50)")
-    parser.add_argument("--rate-limit", type=int, default=10, help="Requests per second (default: 10)")
+    parser.add_argument("--rate-limit", type=int, default=10, help="HTTP probe requests per second to each host (default: 10, 0 = unlimited)")
     parser.add_argument("--timeout", type=int, default=10, help="HTTP request timeout in seconds (default: 10)")
+    parser.add_argument("--max-inflight", type=int, default=300,
+                        help="Max simultaneous DNS/HTTP operations across the scan (default: 300)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Don't read or write the on-disk DNS cache ({DNS_CACHE_PATH})")
+    parser.add_argument("--dns-server", dest="dns_servers", action="append", metavar="IP",
+                        help="DNS server to query (repeatable; several are used in rotation, default: system resolvers)")
+    
+    # Detection options
+    parser.add_argument("--providers-file", metavar="FILE",
+                        help="JSON file of provider signatures to add or override (same keys as the built-in table)")
     
     # Filtering options
     parser.add_argument("--severity-filter", choices=["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"],
@@ -2790,8 +3992,6 @@ Examples:
 
 def check_dependencies():
     """Check required dependencies"""
-    missing = []
-    
     # Check Python version
     if sys.version_info < (3, 7):
         print(f"❌ Python 3.7+ required (you have {sys.version_info.major}.{sys.version_info.minor})")
@@ -2805,11 +4005,9 @@ def check_dependencies():
         ('tldextract', 'tldextract'),
     ]
     
-    for import_name, package_name in required_modules:
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing.append(package_name)
+    # find_spec only locates a module; tldextract and rich stay unimported until first use
+    missing = [package_name for import_name, package_name in required_modules
+               if importlib.util.find_spec(import_name) is None]
     
     if missing:
         print("❌ Missing required packages:")
@@ -2824,12 +4022,8 @@ def check_dependencies():
         ('colorama', 'colorama'),
     ]
     
-    missing_optional = []
-    for import_name, package_name in optional_modules:
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing_optional.append(package_name)
+    missing_optional = [package_name for import_name, package_name in optional_modules
+                        if importlib.util.find_spec(import_name) is None]
     
     if missing_optional:
         print("⚠️ Optional packages missing (enhanced output): " + ", ".join(missing_optional))
@@ -2839,6 +4033,9 @@ def check_dependencies():
 # MAIN FUNCTION
 # ============================================================================
 
+# Parsed command line, set by main(); None until then so the __main__ error handler can test it
+args = None
+
 async def main():
     """Main async function"""
     global args
@@ -2847,6 +4044,17 @@ async def main():
     # Check dependencies
     check_dependencies()
     
+    set_network_limit(args.max_inflight)
+    
+    # Load user provider signatures before anything is matched against them
+    if args.providers_file:
+        try:
+            count = load_providers_file(args.providers_file)
+            ColorPrinter.print(f"Loaded {count} provider definitions from {args.providers_file}", "info")
+        except (OSError, ValueError, TypeError) as e:
+            print(f"❌ Error: Could not load providers file {args.providers_file}: {e}")
+            sys.exit(1)
+    
     # Wire --no-color flag
     if args.no_color:
         ColorPrinter._no_color = True
@@ -2864,21 +4072,13 @@ async def main():
         target_domain = args.domain.lower().strip()
     elif args.single_subdomain:
         # Extract domain from subdomain
-        parts = args.single_subdomain.lower().split('.')
-        if len(parts) >= 2:
-            target_domain = '.'.join(parts[-2:])
-        else:
-            target_domain = args.single_subdomain
+        target_domain = registered_domain(args.single_subdomain)
     elif args.subdomains_file:
         # Try to extract domain from first line
         try:
             with open(args.subdomains_file, 'r') as f:
                 first_line = f.readline().strip().lower()
-                parts = first_line.split('.')
-                if len(parts) >= 2:
-                    target_domain = '.'.join(parts[-2:])
-                else:
-                    target_domain = "unknown"
+                target_domain = registered_domain(first_line) if '.' in first_line else "unknown"
         except:
             target_domain = "unknown"
     
@@ -2892,8 +4092,7 @@ async def main():
     
     # Exit with appropriate code
     if scan_result:
-        critical_findings = [f for f in scan_result.findings 
-                           if f.takeover_status in [TakeoverStatus.CONFIRMED, TakeoverStatus.HIGHLY_LIKELY]]
+        critical_findings = scan_result.critical_findings
         
         if critical_findings:
             if COLOR_AVAILABLE:
@@ -2905,23 +4104,31 @@ async def main():
             if COLOR_AVAILABLE:
                 print(f"\n{Fore.GREEN}✅ Scan completed successfully{Style.RESET_ALL}")
             else:
-                print(f"\n✅ Scan completed successfully")
+                print("\n✅ Scan completed successfully")
             sys.exit(0)
     else:
         if COLOR_AVAILABLE:
             print(f"\n{Fore.RED}❌ Scan failed{Style.RESET_ALL}")
         else:
-            print(f"\n❌ Scan failed")
+            print("\n❌ Scan failed")
         sys.exit(1)
 
+def install_event_loop_policy() -> bool:
+    """Switch asyncio to uvloop when it is installed and supported on this platform"""
+    if not UVLOOP_AVAILABLE or sys.platform == 'win32':
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 if __name__ == "__main__":
     try:
+        install_event_loop_policy()
         asyncio.run(main())
     except KeyboardInterrupt:
         if COLOR_AVAILABLE:
             print(f"\n{Fore.YELLOW}[!] Scan interrupted by user{Style.RESET_ALL}")
         else:
-            print(f"\n[!] Scan interrupted by user")
+            print("\n[!] Scan interrupted by user")
         sys.exit(130)
     except Exception as e:
         if COLOR_AVAILABLE:
@@ -0,0 +1,39 @@
+import pytest
+
+import subsentinal
+
+
+def _config(*cname_patterns):
+    return {'cname_patterns': list(cname_patterns), 'error_patterns': [],
+            'claimed_indicators': [], 'status_codes': []}
+
+
+@pytest.fixture
+def provider_configs():
+    original = {name: dict(config) for name, config in subsentinal.PROVIDER_CONFIGS.items()}
+    yield subsentinal.use_provider_configs
+    subsentinal.use_provider_configs(original)
+
+
+def test_bare_apex_listed_with_and_without_leading_dot(provider_configs):
+    provider_configs({'AWS S3': _config('.s3.amazonaws.com', 's3.amazonaws.com')})
+    assert subsentinal.match_cname('s3.amazonaws.com') == 'AWS S3'
+    assert subsentinal.match_cname('bucket.s3.amazonaws.com.') == 'AWS S3'
+
+
+def test_leading_dot_pattern_needs_another_label(provider_configs):
+    provider_configs({'GitHub Pages': _config('.github.io')})
+    assert subsentinal.match_cname('github.io') is None
+    assert subsentinal.match_cname('user.github.io') == 'GitHub Pages'
+
+
+def test_bare_apex_falls_to_provider_allowing_it(provider_configs):
+    provider_configs({'First': _config('.example.net'), 'Second': _config('example.net')})
+    assert subsentinal.match_cname('example.net') == 'Second'
+    assert subsentinal.match_cname('a.example.net') == 'First'
+
+
+def test_deepest_suffix_wins(provider_configs):
+    provider_configs({'Azure': _config('.cloudapp.net'), 'Azure TM': _config('.trafficmanager.cloudapp.net')})
+    assert subsentinal.match_cname('x.trafficmanager.cloudapp.net') == 'Azure TM'
+    assert subsentinal.match_cname('x.cloudapp.net') == 'Azure'
@@ -0,0 +1,49 @@
+import shelve
+import time
+
+import dns.rdata
+import pytest
+
+import subsentinal
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    yield str(tmp_path / "dns")
+    subsentinal.close_dns_cache()
+
+
+def _a(ip):
+    return [dns.rdata.from_text('IN', 'A', ip)]
+
+
+def test_open_drops_expired_and_unreadable_entries(cache_path):
+    with shelve.open(cache_path) as shelf:
+        shelf['A:live.example.com'] = (time.time() + 100, ['192.0.2.1'])
+        shelf['A:old.example.com'] = (time.time() - 1, ['192.0.2.2'])
+        shelf['A:junk.example.com'] = 'not a cache entry'
+    subsentinal.open_dns_cache(cache_path)
+    subsentinal.close_dns_cache()
+    with shelve.open(cache_path) as shelf:
+        assert sorted(shelf.keys()) == ['A:live.example.com']
+
+
+def test_undecodable_entry_is_a_miss_and_forgotten(cache_path):
+    with shelve.open(cache_path) as shelf:
+        shelf['A:bad.example.com'] = (time.time() + 100, ['not an address'])
+    subsentinal.open_dns_cache(cache_path)
+    assert subsentinal._dns_cache_get('A:bad.example.com', 'A') is None
+    subsentinal.close_dns_cache()
+    with shelve.open(cache_path) as shelf:
+        assert 'A:bad.example.com' not in shelf
+
+
+def test_close_keeps_latest_expiring_entries_up_to_cap(cache_path, monkeypatch):
+    monkeypatch.setattr(subsentinal, 'DNS_CACHE_MAX_ENTRIES', 2)
+    subsentinal.open_dns_cache(cache_path)
+    for i in range(4):
+        subsentinal._dns_cache_put(f'A:h{i}.example.com', 1000 + i, _a('192.0.2.1'))
+    subsentinal.close_dns_cache()
+    subsentinal.open_dns_cache(cache_path)
+    assert subsentinal._dns_cache_get('A:h3.example.com', 'A') == _a('192.0.2.1')
+    assert subsentinal._dns_cache_get('A:h0.example.com', 'A') is None